@@ -306,6 +306,20 @@ class LocalCache:
         Args:
             entry: Cache entry to add
             
+        Returns:
+            True if add succeeded, False otherwise
+        """
+        return self.add_entries([entry])
+
+    def add_entries(self, entries: List[CacheEntry]) -> bool:
+        """Add several entries to the cache in a single locked read/write.
+        
+        Entries whose URL already exists replace the existing entry (later
+        entries in the list win). Enforces max_entries limit via FIFO eviction.
+        
+        Args:
+            entries: Cache entries to add
+            
         Returns:
             True if add succeeded, False otherwise
         """
@@ -315,30 +329,20 @@ class LocalCache:
         try:
             with self._get_lock():
                 cache_data = self._load_unlocked()
-                entries = cache_data.entries
-                
-                # Check for existing entry with same URL
-                existing_idx = None
-                for i, e in enumerate(entries):
-                    if e.url == entry.url:
-                        existing_idx = i
-                        break
                 
-                if existing_idx is not None:
-                    # Update existing entry
-                    entries[existing_idx] = entry
-                else:
-                    # Add new entry
-                    entries.append(entry)
+                # Index by URL so new entries replace existing ones in place
+                by_url = {e.url: e for e in cache_data.entries}
+                for entry in entries:
+                    by_url[entry.url] = entry
                 
                 # Sort by timestamp (newest first) and enforce limit
-                entries.sort(key=lambda e: e.timestamp, reverse=True)
-                cache_data.entries = entries[: self.max_entries]
+                merged = sorted(by_url.values(), key=lambda e: e.timestamp, reverse=True)
+                cache_data.entries = merged[: self.max_entries]
                 
                 return self._save_unlocked(cache_data)
                 
         except Exception as e:
-            logger.warning(f"Error adding cache entry: {e}")
+            logger.warning(f"Error adding cache entries: {e}")
             return False
 
     def get_recent(self, limit: int = 10) -> List[CacheEntry]:
@@ -34,6 +34,7 @@ class Settings(BaseSettings):
     browserless_api_key: Optional[str] = None
     browserless_use_unblock: bool = True
     browserless_use_residential_proxy: bool = False
+    browserless_max_concurrency: int = Field(default=20, ge=1)  # Max in-flight /unblock requests
 
     # API Settings
     api_host: str = "0.0.0.0"
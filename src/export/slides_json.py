@@ -39,14 +39,12 @@ class SlidesJSONGenerator:
         r'twitter\.com/.*/video',
         r'x\.com/.*/video',
     ]
+    # Compiled once for the class; every slide checks URLs and raw text against it
+    _video_regex = re.compile('|'.join(VIDEO_PATTERNS), re.IGNORECASE)
     
     # Minimum quote length for quote slide detection (requires context/attribution)
     QUOTE_MIN_LENGTH = 30
 
-    def __init__(self):
-        """Initialize the JSON slides generator."""
-        self._video_regex = re.compile('|'.join(self.VIDEO_PATTERNS), re.IGNORECASE)
-
     def generate(self, results: List[ProcessedResult]) -> str:
         """
         Generate JSON slides output from processed results.
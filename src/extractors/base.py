@@ -24,6 +24,7 @@ class BaseExtractor(ABC):
 
     url_type: URLType = URLType.UNKNOWN
     extraction_method: str = "base"
+    http2: bool = False  # Requires the optional h2 package
 
     def __init__(self, timeout: int = 30):
         """Initialize the extractor with a timeout."""
@@ -36,6 +37,7 @@ class BaseExtractor(ABC):
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.timeout),
                 follow_redirects=True,
+                http2=self.http2,
                 headers={
                     "User-Agent": (
                         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -53,6 +55,12 @@ class BaseExtractor(ABC):
         if self._client and not self._client.is_closed:
             await self._client.aclose()
 
+    async def __aenter__(self) -> "BaseExtractor":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
     @abstractmethod
     async def extract(self, url: str) -> ExtractedContent:
         """
@@ -1,9 +1,15 @@
 """Unblock extractor using Browserless /unblock API for bot detection bypass."""
 
 import asyncio
+import importlib.util
+import json
 import logging
-from datetime import datetime
-from typing import Optional
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Dict, Optional, Tuple
 from urllib.parse import urlparse
 
 import httpx
@@ -12,17 +18,83 @@ import trafilatura
 from src.config import get_settings
 from src.extractors.base import BaseExtractor, ExtractionError
 from src.models.schemas import ExtractedContent, URLType
+from src.utils.circuit_breaker import get_fallback_circuit_breaker
+
+try:
+    # Optional: faster parsing of large HTML payloads (pip install .[speedups])
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 # Browserless API endpoint
 BROWSERLESS_UNBLOCK_URL = "https://production-sfo.browserless.io/unblock"
 
+# Service name for the shared fallback circuit breaker
+BROWSERLESS_CIRCUIT_SERVICE = "browserless_unblock"
+
+# HTTP/2 lets concurrent /unblock requests share one connection, but httpx
+# only supports it with the optional h2 package (pip install .[speedups])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 # Default retry settings
 DEFAULT_MAX_RETRIES = 2
 DEFAULT_RETRY_DELAY = 1.0  # seconds
 
 
+class UnblockAPIError(ExtractionError):
+    """Raised when the /unblock API responds with an HTTP error status."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int,
+        retry_after: Optional[float] = None,
+    ):
+        self.status_code = status_code
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class UnblockConnectionError(ExtractionError):
+    """Raised when the /unblock API cannot be reached at all."""
+
+    pass
+
+
+def _json_loads(data: bytes):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds to wait.
+    
+    Accepts either delay-seconds or an HTTP-date. Returns None if the
+    header is missing or malformed.
+    """
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 class UnblockExtractor(BaseExtractor):
     """
     Extract content using Browserless /unblock API.
@@ -37,6 +109,21 @@ class UnblockExtractor(BaseExtractor):
 
     url_type = URLType.NEWS_ARTICLE
     extraction_method = "browserless_unblock"
+    http2 = HTTP2_AVAILABLE
+
+    # Backoff configuration
+    BACKOFF_MAX_DELAY = 30.0  # seconds
+
+    # Throttling and transient server errors worth another attempt
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    # Retries allowed when Browserless refuses connections outright
+    CONNECT_ERROR_MAX_RETRIES = 1
+
+    # How long fetched HTML is reused for repeat requests
+    CACHE_TTL = 300.0  # seconds
+    # Cap on cached pages; rendered HTML is large and the API keeps one agent
+    CACHE_MAX_ENTRIES = 128
 
     def __init__(self, timeout: Optional[int] = None):
         """
@@ -54,6 +141,23 @@ class UnblockExtractor(BaseExtractor):
         self._use_residential_proxy = getattr(
             settings, 'browserless_use_residential_proxy', False
         )
+        
+        # Settings don't change per process, so build the endpoint URL once
+        self._endpoint = f"{BROWSERLESS_UNBLOCK_URL}?token={self._api_key}"
+        if self._use_residential_proxy:
+            self._endpoint += "&proxy=residential"
+        # Fields shared by every request; the token and proxy go in the URL
+        self._payload_base = {"content": True}
+        
+        # Bulkhead: cap in-flight /unblock requests so a large batch queues
+        # here instead of piling onto the connection pool and Browserless
+        max_concurrency = getattr(settings, 'browserless_max_concurrency', 20)
+        self._request_semaphore = asyncio.Semaphore(max(1, max_concurrency or 20))
+        
+        # Successful fetches keyed by (url, wait_for_timeout, wait_for_selector),
+        # and fetches in progress so concurrent duplicates share one request
+        self._html_cache: Dict[Tuple, Tuple[float, str]] = {}
+        self._pending_fetches: Dict[Tuple, asyncio.Task] = {}
 
     def can_handle(self, url: str) -> bool:
         """
@@ -72,14 +176,20 @@ class UnblockExtractor(BaseExtractor):
         url: str,
         wait_for_timeout: Optional[int] = None,
         wait_for_selector: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> str:
         """
         Fetch rendered HTML content using the /unblock API.
         
+        Successful results are reused for CACHE_TTL seconds, and concurrent
+        calls with the same arguments share a single API request.
+        
         Args:
             url: URL to fetch content from.
             wait_for_timeout: Optional milliseconds to wait before scraping.
             wait_for_selector: Optional CSS selector to wait for before scraping.
+            timeout: Seconds allowed for the request, including waiting for a
+                free request slot. Defaults to the extractor timeout.
             
         Returns:
             Rendered HTML content as string.
@@ -93,21 +203,73 @@ class UnblockExtractor(BaseExtractor):
                 "Set BROWSERLESS_API_KEY environment variable."
             )
 
+        key = (url, wait_for_timeout, wait_for_selector)
+        
+        cached = self._html_cache.get(key)
+        if cached:
+            if time.monotonic() - cached[0] < self.CACHE_TTL:
+                return cached[1]
+            del self._html_cache[key]
+        
+        timeout = timeout or self.timeout
+        
+        # Shield so one caller giving up, the one that started the request
+        # included, doesn't cancel it for the others
+        task = self._pending_fetches.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._request_content(url, wait_for_timeout, wait_for_selector, timeout)
+            )
+            self._pending_fetches[key] = task
+            task.add_done_callback(partial(self._finish_fetch, key))
+            # The request itself is already bounded by this caller's timeout
+            return await asyncio.shield(task)
+        
+        # Another caller's request may have been given longer than this one
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except TimeoutError:
+            raise ExtractionError(
+                f"Unblock API request timed out for: {url}"
+            ) from None
+
+    def _finish_fetch(self, key: Tuple, task: asyncio.Task) -> None:
+        """Clear a finished fetch from the pending map, caching it on success."""
+        self._pending_fetches.pop(key, None)
+        # exception() also marks failures retrieved if every caller gave up
+        if not task.cancelled() and task.exception() is None:
+            self._store_cached(key, task.result())
+
+    def _store_cached(self, key: Tuple, html: str) -> None:
+        """Cache fetched HTML, dropping expired entries and the oldest past the cap."""
+        now = time.monotonic()
+        self._html_cache.pop(key, None)
+        
+        # Entries stay in insertion (= time) order, so the oldest are in front
+        while self._html_cache:
+            oldest_key = next(iter(self._html_cache))
+            if (
+                len(self._html_cache) < self.CACHE_MAX_ENTRIES
+                and now - self._html_cache[oldest_key][0] < self.CACHE_TTL
+            ):
+                break
+            del self._html_cache[oldest_key]
+        
+        self._html_cache[key] = (now, html)
+
+    async def _request_content(
+        self,
+        url: str,
+        wait_for_timeout: Optional[int],
+        wait_for_selector: Optional[str],
+        timeout: float,
+    ) -> str:
+        """Make a single /unblock API request and return the HTML content."""
         try:
             client = await self.get_client()
             
-            # Build the API endpoint URL with token
-            endpoint = f"{BROWSERLESS_UNBLOCK_URL}?token={self._api_key}"
-            
-            # Add residential proxy if configured
-            if self._use_residential_proxy:
-                endpoint += "&proxy=residential"
-            
             # Request payload - we want HTML content back
-            payload = {
-                "url": url,
-                "content": True,
-            }
+            payload = {"url": url, **self._payload_base}
             
             # Add optional waitFor options
             if wait_for_timeout is not None:
@@ -116,20 +278,27 @@ class UnblockExtractor(BaseExtractor):
             if wait_for_selector is not None:
                 payload["waitForSelector"] = {"selector": wait_for_selector}
             
-            response = await client.post(
-                endpoint,
-                json=payload,
-                timeout=self.timeout,
-            )
+            # The timeout covers queueing for a slot as well as the request
+            async with asyncio.timeout(timeout):
+                async with self._request_semaphore:
+                    response = await client.post(
+                        self._endpoint,
+                        json=payload,
+                        timeout=timeout,
+                    )
             
             # Handle HTTP errors
             if response.status_code >= 400:
-                raise ExtractionError(
-                    f"Unblock API returned status {response.status_code}: {response.text}"
+                raise UnblockAPIError(
+                    f"Unblock API returned status {response.status_code}: {response.text}",
+                    status_code=response.status_code,
+                    retry_after=_parse_retry_after(
+                        response.headers.get("retry-after")
+                    ),
                 )
             
             # Parse response
-            data = response.json()
+            data = _json_loads(response.content)
             content = data.get("content")
             
             if not content:
@@ -139,12 +308,12 @@ class UnblockExtractor(BaseExtractor):
             
             return content
             
-        except httpx.TimeoutException:
+        except (httpx.TimeoutException, TimeoutError):
             raise ExtractionError(
                 f"Unblock API request timed out for: {url}"
             ) from None
         except httpx.ConnectError as e:
-            raise ExtractionError(
+            raise UnblockConnectionError(
                 f"Unblock API request failed: Connection refused"
             ) from None
         except httpx.HTTPError as e:
@@ -173,69 +342,139 @@ class UnblockExtractor(BaseExtractor):
         retry_delay: float = DEFAULT_RETRY_DELAY,
         wait_for_timeout: Optional[int] = None,
         wait_for_selector: Optional[str] = None,
+        total_timeout: Optional[float] = None,
     ) -> str:
         """
         Fetch content with automatic retry on transient failures.
         
         Retries on:
-        - 5xx server errors
+        - 429 rate limiting and 500/502/503/504 server errors, waiting at
+          least as long as any Retry-After header asks (giving up instead
+          if that would run past the deadline)
         - Timeout errors
-        - Connection errors
+        - Connection errors (at most CONNECT_ERROR_MAX_RETRIES times)
         
         Does NOT retry on:
-        - 4xx client errors (indicates a problem with the request)
+        - Other 4xx/5xx errors (indicates a problem with the request)
         - Empty content responses
         
+        Calls go through the shared fallback circuit breaker: once enough
+        fetches have exhausted their retries on transient errors, further
+        calls fail fast without contacting Browserless until it resets.
+        
         Args:
             url: URL to fetch content from.
             max_retries: Maximum number of retry attempts.
-            retry_delay: Base delay between retries (exponential backoff).
+            retry_delay: Base delay between retries (exponential backoff
+                with full jitter).
             wait_for_timeout: Optional milliseconds to wait before scraping.
             wait_for_selector: Optional CSS selector to wait for before scraping.
+            total_timeout: Seconds allowed for all attempts, including time
+                queued behind other requests, and backoff sleeps together.
+                Defaults to the extractor timeout. What remains is split
+                evenly across the attempts still allowed.
             
         Returns:
             Rendered HTML content as string.
             
         Raises:
-            ExtractionError: If all retry attempts fail.
+            ExtractionError: If all retry attempts fail or the circuit is open.
         """
+        breaker = get_fallback_circuit_breaker()
+        if not breaker.allow_request(BROWSERLESS_CIRCUIT_SERVICE):
+            raise ExtractionError(
+                f"Unblock API circuit open, skipping request for: {url}"
+            )
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (total_timeout or self.timeout)
         last_error = None
         
         for attempt in range(max_retries + 1):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                # Only retryable errors get this far, so this counts against health
+                breaker.record_failure(BROWSERLESS_CIRCUIT_SERVICE)
+                raise ExtractionError(
+                    f"Unblock API deadline exceeded for: {url}"
+                ) from last_error
+            
+            # Split what's left across the remaining attempts so one hung
+            # request can't use up the whole budget and rule out a retry
+            attempt_timeout = remaining / (max_retries + 1 - attempt)
+            
             try:
-                return await self.fetch_content(
+                html = await self.fetch_content(
                     url,
                     wait_for_timeout=wait_for_timeout,
                     wait_for_selector=wait_for_selector,
+                    timeout=attempt_timeout,
                 )
+                breaker.record_success(BROWSERLESS_CIRCUIT_SERVICE)
+                return html
             except ExtractionError as e:
-                error_str = str(e).lower()
+                is_retryable = self._is_retryable(e)
+                retries_allowed = max_retries
+                if isinstance(e, UnblockConnectionError):
+                    # Nothing is listening; one retry covers a blip, more
+                    # just burns the batch's time before the breaker opens
+                    retries_allowed = min(max_retries, self.CONNECT_ERROR_MAX_RETRIES)
                 
-                # Don't retry on 4xx errors - these are client errors
-                if "status 4" in error_str:
+                if not is_retryable or attempt >= retries_allowed:
+                    # Only transient failures say anything about Browserless health
+                    if is_retryable:
+                        breaker.record_failure(BROWSERLESS_CIRCUIT_SERVICE)
                     raise
                 
-                # Retry on 5xx errors, timeouts, and connection errors
-                is_retryable = (
-                    "status 5" in error_str
-                    or "timed out" in error_str
-                    or "connection" in error_str
-                )
+                delay = self._calculate_backoff_delay(attempt, retry_delay)
                 
-                if is_retryable and attempt < max_retries:
-                    delay = retry_delay * (2 ** attempt)  # Exponential backoff
-                    logger.warning(
-                        f"Unblock API attempt {attempt + 1} failed for {url}: {e}. "
-                        f"Retrying in {delay:.1f}s..."
-                    )
-                    await asyncio.sleep(delay)
-                    last_error = e
-                else:
+                # Honor Retry-After as long as the wait fits in the deadline
+                retry_after = getattr(e, "retry_after", None)
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                
+                # No point sleeping past the deadline just to give up after
+                if loop.time() + delay >= deadline:
+                    breaker.record_failure(BROWSERLESS_CIRCUIT_SERVICE)
                     raise
+                logger.warning(
+                    f"Unblock API attempt {attempt + 1} failed for {url}: {e}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+                last_error = e
         
         # Should not reach here, but just in case
         raise last_error or ExtractionError(f"Failed to fetch content from: {url}")
 
+    def _is_retryable(self, error: ExtractionError) -> bool:
+        """Check whether a failed fetch is worth another attempt."""
+        if isinstance(error, UnblockAPIError):
+            # Only throttling and transient server errors are retried
+            return error.status_code in self.RETRYABLE_STATUS_CODES
+        
+        # Retry on timeouts and connection errors
+        error_str = str(error).lower()
+        return "timed out" in error_str or "connection" in error_str
+
+    def _calculate_backoff_delay(self, attempt: int, base_delay: float) -> float:
+        """
+        Calculate exponential backoff delay with full jitter.
+        
+        Sleeping a random amount up to the exponential ceiling spreads
+        retries out, so a batch hitting a Browserless outage together
+        doesn't retry in lockstep.
+        
+        Args:
+            attempt: The attempt number (0-indexed).
+            base_delay: Delay ceiling for the first retry, in seconds.
+            
+        Returns:
+            Delay in seconds before the next attempt.
+        """
+        ceiling = min(self.BACKOFF_MAX_DELAY, base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
     async def extract(self, url: str) -> ExtractedContent:
         """
         Extract content using the /unblock API and parse with trafilatura.
@@ -15,8 +15,10 @@ import asyncio
 import json
 import logging
 from datetime import datetime
+from typing import List, Union
 
 import streamlit as st
+from pydantic import TypeAdapter
 
 # Configure logging for server-side error tracking
 logger = logging.getLogger(__name__)
@@ -27,6 +29,9 @@ from src.export.pdf_report import PDFReportGenerator
 from src.export.slides_deck import SlidesDeckGenerator
 from src.models.schemas import ProcessedResult, ProcessingStatus, Sentiment, URLType
 
+# Validates a whole batch of results straight from JSON text/bytes in pydantic-core
+_BATCH_RESULTS_ADAPTER = TypeAdapter(List[ProcessedResult])
+
 
 # Initialize cache singleton (cached across Streamlit reruns)
 @st.cache_resource
@@ -117,17 +122,35 @@ def get_sentiment_color(sentiment: Sentiment) -> str:
     return mapping.get(sentiment, "gray")
 
 
+_GREEN_RATINGS = frozenset({"true", "mostly_true"})
+_RED_RATINGS = frozenset({"false", "mostly_false"})
+
+
 def get_rating_color(rating_value: str) -> str:
     """Get color for fact-check rating."""
     rating_value = rating_value.lower().strip() if rating_value else ""
-    if rating_value in ["true", "mostly_true"]:
+    if rating_value in _GREEN_RATINGS:
         return "green"
-    elif rating_value in ["false", "mostly_false"]:
+    elif rating_value in _RED_RATINGS:
         return "red"
     else:  # mixed, unverified, insufficient_data, etc.
         return "orange"
 
 
+def serialize_batch_results(results: List[ProcessedResult]) -> str:
+    """Serialize batch results to JSON for storage in a cached BatchRun."""
+    return _BATCH_RESULTS_ADAPTER.dump_json(results).decode("utf-8")
+
+
+def restore_batch_results(results_json: Union[str, bytes]) -> List[ProcessedResult]:
+    """Restore batch results from a cached BatchRun's JSON (str or bytes).
+
+    The JSON is handed to pydantic directly rather than decoded with
+    json.loads first, so no intermediate dict tree is built.
+    """
+    return _BATCH_RESULTS_ADAPTER.validate_json(results_json)
+
+
 def run_async(coro):
     """Run async coroutine in sync context."""
     try:
@@ -457,8 +480,7 @@ def main():
         batch = get_cache().get_batch_by_id(batch_id)
         if batch and batch.results_json:
             try:
-                results_data = json.loads(batch.results_json)
-                results = [ProcessedResult.model_validate(r) for r in results_data]
+                results = restore_batch_results(batch.results_json)
                 st.session_state.batch_results = results
                 st.session_state.batch_urls = batch.urls
                 st.success(f"📋 Restored batch from {batch.timestamp.strftime('%m/%d %H:%M')}")
@@ -723,7 +745,7 @@ def main():
                         url_count=len(results),
                         success_count=completed_count,
                         failed_count=failed_count,
-                        results_json=json.dumps([r.model_dump(mode='json') for r in results]),
+                        results_json=serialize_batch_results(results),
                     )
                     cache.add_batch_run(batch_run)
 
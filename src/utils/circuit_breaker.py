@@ -62,6 +62,7 @@ class CircuitBreaker:
         self._failures: Dict[str, int] = {}
         self._last_failure_time: Dict[str, float] = {}
         self._state: Dict[str, str] = {}  # "closed", "open", "half-open"
+        self._probe_started: Dict[str, float] = {}  # In-flight half-open test
         
         # Thread safety
         self._lock = threading.Lock()
@@ -97,8 +98,17 @@ class CircuitBreaker:
                 return True
             
             if state == "half-open":
-                # Allow one test request, transition to half-open
+                # Allow one test request at a time; a probe that never
+                # reported back stops blocking after another reset_timeout
+                probe_started = self._probe_started.get(service)
+                now = time.time()
+                if (
+                    probe_started is not None
+                    and now - probe_started < self.reset_timeout
+                ):
+                    return False
                 self._state[service] = "half-open"
+                self._probe_started[service] = now
                 return True
             
             # state == "open"
@@ -110,6 +120,7 @@ class CircuitBreaker:
             current_failures = self._failures.get(service, 0) + 1
             self._failures[service] = current_failures
             self._last_failure_time[service] = time.time()
+            self._probe_started.pop(service, None)
             
             current_state = self._get_state_internal(service)
             
@@ -133,6 +144,7 @@ class CircuitBreaker:
             # Reset on success
             self._failures[service] = 0
             self._state[service] = "closed"
+            self._probe_started.pop(service, None)
             
             if current_state == "half-open":
                 logger.info(f"Circuit breaker: {service} closed after successful test")
@@ -149,10 +161,12 @@ class CircuitBreaker:
                 self._failures.pop(service, None)
                 self._last_failure_time.pop(service, None)
                 self._state.pop(service, None)
+                self._probe_started.pop(service, None)
             else:
                 self._failures.clear()
                 self._last_failure_time.clear()
                 self._state.clear()
+                self._probe_started.clear()
 
     async def call(
         self,
@@ -6,15 +6,15 @@ and multi-line input parsing for the batch processing UI.
 
 import re
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
-from urllib.parse import urlparse
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of validating a single URL."""
     is_valid: bool
@@ -22,7 +22,8 @@ class ValidationResult:
     error: Optional[str] = None
 
 
-@dataclass
+# Slotted but not frozen: parse_url_input and sanitize_url_list fill these in
+@dataclass(slots=True)
 class ParseResult:
     """Result of parsing multi-line URL input."""
     valid_urls: List[str] = field(default_factory=list)
@@ -32,7 +33,7 @@ class ParseResult:
     warnings: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SanitizedUrls:
     """Result of sanitizing a list of URLs."""
     urls: List[str] = field(default_factory=list)
@@ -57,6 +58,23 @@ class SanitizedUrls:
 # The pattern matches: [link text](url content until last closing paren)
 MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]*)\]\((.+)\)$')
 
+# Host (with optional userinfo/port) made only of ASCII URL characters. Anything
+# else - IPv6 brackets, whitespace, non-ASCII that urlsplit NFKC-checks for
+# CVE-2019-9636 - must go through urlsplit instead of a fast path.
+_PLAIN_HOST = r"[A-Za-z0-9._~%!$&'()*+,;=:@-]+"
+
+# Matches http(s) URLs with a plain, non-empty host so validate_url can accept
+# them without a full urlsplit.
+HTTP_URL_PATTERN = re.compile(r'https?://' + _PLAIN_HOST + r'(?=[/?#]|$)', re.IGNORECASE)
+
+# Matches a whole input line holding nothing but a plain http(s) URL (the
+# HTTP_URL_PATTERN host rules, no interior whitespace). parse_url_input runs it
+# once over the full text so those lines skip per-line validation.
+PLAIN_URL_LINE_PATTERN = re.compile(
+    r'^[ \t]*(https?://' + _PLAIN_HOST + r'(?:[/?#]\S*)?)[ \t]*\r?$',
+    re.IGNORECASE | re.MULTILINE,
+)
+
 # Maximum URLs before warning user about large batch
 MAX_URLS_BEFORE_WARNING = 100
 
@@ -80,6 +98,10 @@ def extract_url_from_markdown(text: str) -> Optional[str]:
     
     text = text.strip()
     
+    # Most lines are plain URLs; skip the regex unless it could be a link
+    if not text.startswith('['):
+        return None
+    
     # Check if the text matches markdown link pattern
     match = MARKDOWN_LINK_PATTERN.match(text)
     if match:
@@ -120,9 +142,13 @@ def validate_url(url: Optional[str]) -> ValidationResult:
     
     url = url.strip()
     
+    # Fast path for the common case of a well-formed http(s) URL
+    if HTTP_URL_PATTERN.match(url):
+        return ValidationResult(is_valid=True, url=url, error=None)
+    
     # Parse the URL
     try:
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
     except Exception as e:
         return ValidationResult(
             is_valid=False,
@@ -168,10 +194,10 @@ def validate_url(url: Optional[str]) -> ValidationResult:
 def _normalize_url_for_dedup(url: str) -> str:
     """
     Normalize URL for deduplication purposes.
-    Removes trailing slashes for comparison.
+    Removes trailing slashes for comparison, so a bare host and the same
+    host with "/" also count as one URL. Plain string work, no re-parse.
     """
-    url = url.rstrip('/')
-    return url
+    return url.rstrip('/')
 
 
 def parse_url_input(text: str) -> ParseResult:
@@ -199,43 +225,56 @@ def parse_url_input(text: str) -> ParseResult:
     lines = text.split('\n')
     seen_urls: set = set()  # For deduplication (normalized form)
     
+    # Plain URL lines found in one pass, keyed by the offset the line starts at
+    plain_urls = {
+        match.start(): match.group(1)
+        for match in PLAIN_URL_LINE_PATTERN.finditer(text)
+    }
+    line_start = 0
+    
     for line_number, line in enumerate(lines, start=1):
-        # Strip whitespace
-        stripped = line.strip()
-        
-        # Skip empty lines
-        if not stripped:
-            result.skipped_lines += 1
-            continue
-        
-        # Skip comment lines
-        if stripped.startswith('#') or stripped.startswith('//'):
-            result.skipped_lines += 1
-            continue
+        url = plain_urls.get(line_start)
+        line_start += len(line) + 1
         
-        # Try to extract URL from markdown syntax first
-        extracted_url = extract_url_from_markdown(stripped)
-        url_to_validate = extracted_url if extracted_url else stripped
-        
-        # Validate the URL
-        validation = validate_url(url_to_validate)
-        
-        if not validation.is_valid:
-            result.invalid_lines.append((
-                line_number,
-                stripped[:100],  # Truncate very long lines
-                validation.error or "Invalid URL"
-            ))
-            continue
+        if url is None:
+            # Strip whitespace
+            stripped = line.strip()
+            
+            # Skip empty lines
+            if not stripped:
+                result.skipped_lines += 1
+                continue
+            
+            # Skip comment lines
+            if stripped.startswith('#') or stripped.startswith('//'):
+                result.skipped_lines += 1
+                continue
+            
+            # Try to extract URL from markdown syntax first
+            extracted_url = extract_url_from_markdown(stripped)
+            url_to_validate = extracted_url if extracted_url else stripped
+            
+            # Validate the URL
+            validation = validate_url(url_to_validate)
+            
+            if not validation.is_valid:
+                result.invalid_lines.append((
+                    line_number,
+                    stripped[:100],  # Truncate very long lines
+                    validation.error or "Invalid URL"
+                ))
+                continue
+            
+            url = validation.url
         
         # Check for duplicates using normalized form
-        normalized = _normalize_url_for_dedup(validation.url)
+        normalized = _normalize_url_for_dedup(url)
         if normalized in seen_urls:
             result.duplicates_removed += 1
             continue
         
         seen_urls.add(normalized)
-        result.valid_urls.append(validation.url)
+        result.valid_urls.append(url)
     
     # Warn if too many URLs
     if len(result.valid_urls) > MAX_URLS_BEFORE_WARNING:
@@ -266,17 +305,14 @@ def sanitize_url_list(urls: List[str]) -> SanitizedUrls:
     if not urls:
         return result
     
-    seen: set = set()
+    # Normalized form -> first spelling seen; dicts keep insertion order
+    first_seen: Dict[str, str] = {}
     
     for url in urls:
-        normalized = _normalize_url_for_dedup(url)
-        
-        if normalized in seen:
-            result.duplicates_removed += 1
-            continue
-        
-        seen.add(normalized)
-        result.urls.append(url)
+        first_seen.setdefault(_normalize_url_for_dedup(url), url)
+    
+    result.urls = list(first_seen.values())
+    result.duplicates_removed = len(urls) - len(first_seen)
     
     return result
 
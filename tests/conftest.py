@@ -0,0 +1,57 @@
+"""Shared pytest configuration for the test suite."""
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+
+class _StreamlitStub(types.ModuleType):
+    """Lightweight stand-in for the streamlit module.
+
+    Any public attribute resolves to another stub (cached on first access),
+    and calls, decorators, ``with`` blocks and ``in`` checks are all no-ops.
+    Cheaper than MagicMock since nothing records calls.
+    """
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        child = _StreamlitStub(f"{self.__name__}.{name}")
+        setattr(self, name, child)
+        return child
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __contains__(self, key):
+        # Lets `if "key" not in st.session_state:` initialization run
+        return key in self.__dict__
+
+
+# Stub out streamlit before any test module imports src.streamlit_app, so
+# module-level st.* calls (set_page_config, markdown, session_state) are no-ops.
+# conftest is imported ahead of test collection, so this runs once per process.
+sys.modules.setdefault("streamlit", _StreamlitStub("streamlit"))
+
+
+_STREAMLIT_APP_PATH = Path(__file__).parent.parent / "src" / "streamlit_app.py"
+
+
+@pytest.fixture(scope="session")
+def streamlit_app_source():
+    """Source of src/streamlit_app.py, read once per session for static checks."""
+    return _STREAMLIT_APP_PATH.read_text()
+
+
+@pytest.fixture(scope="session")
+def streamlit_app_lines(streamlit_app_source):
+    """streamlit_app.py split into lines, for checks that care about position."""
+    return streamlit_app_source.split("\n")
@@ -22,6 +22,9 @@ import pytest
 # Test Fixtures
 # =============================================================================
 
+# Frozen clock shared by fixtures so timestamps are deterministic across runs
+FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 @pytest.fixture
 def temp_cache_dir():
@@ -37,7 +40,7 @@ def sample_entry_data():
         "url": "https://example.com/article1",
         "title": "Test Article Title",
         "status": "completed",
-        "timestamp": datetime.now(timezone.utc),
+        "timestamp": FIXED_NOW,
         "source_type": "news_article",
     }
 
@@ -45,13 +48,12 @@ def sample_entry_data():
 @pytest.fixture
 def sample_entries_list():
     """Multiple sample entries for testing ordering and limits."""
-    base_time = datetime.now(timezone.utc)
     return [
         {
             "url": f"https://example.com/article{i}",
             "title": f"Article {i}",
             "status": "completed" if i % 2 == 0 else "failed",
-            "timestamp": base_time - timedelta(hours=i),
+            "timestamp": FIXED_NOW - timedelta(hours=i),
             "source_type": "news_article",
         }
         for i in range(15)
@@ -136,6 +138,73 @@ class TestCacheAddEntry:
         assert len(entries) == 5
 
 
+class TestCacheAddEntries:
+    """Tests for adding several entries in one call."""
+
+    def test_cache_add_entries_success(self, temp_cache_dir, sample_entries_list):
+        """All entries should be stored with a single call."""
+        from src.cache.cache import CacheEntry, LocalCache
+        
+        cache = LocalCache(cache_dir=temp_cache_dir)
+        result = cache.add_entries([CacheEntry(**d) for d in sample_entries_list[:5]])
+        
+        assert result is True
+        entries = cache.get_recent(limit=10)
+        assert len(entries) == 5
+        assert entries[0].timestamp == FIXED_NOW
+
+    def test_cache_add_entries_writes_once(self, temp_cache_dir, sample_entries_list):
+        """A batch add should load and save the cache file only once."""
+        from src.cache.cache import CacheEntry, LocalCache
+        
+        cache = LocalCache(cache_dir=temp_cache_dir)
+        entries = [CacheEntry(**d) for d in sample_entries_list]
+        
+        with patch.object(cache, "_save_unlocked", wraps=cache._save_unlocked) as save:
+            cache.add_entries(entries)
+        
+        assert save.call_count == 1
+        assert len(cache.load()) == len(sample_entries_list)
+
+    def test_cache_add_entries_deduplicates_and_limits(self, temp_cache_dir):
+        """Duplicate URLs should collapse and max_entries should be enforced."""
+        from src.cache.cache import CacheEntry, LocalCache
+        
+        cache = LocalCache(cache_dir=temp_cache_dir, max_entries=3)
+        cache.add_entry(CacheEntry(
+            url="https://example.com/article0",
+            title="Original Title",
+            status="completed",
+            timestamp=FIXED_NOW - timedelta(days=1),
+        ))
+        
+        cache.add_entries([
+            CacheEntry(
+                url=f"https://example.com/article{i}",
+                title=f"Article {i}",
+                status="completed",
+                timestamp=FIXED_NOW + timedelta(minutes=i),
+            )
+            for i in range(4)
+        ])
+        
+        entries = cache.get_recent(limit=10)
+        assert [e.url for e in entries] == [
+            "https://example.com/article3",
+            "https://example.com/article2",
+            "https://example.com/article1",
+        ]
+
+    def test_cache_add_entries_unwritable_returns_false(self, temp_cache_dir, sample_entry_data):
+        """add_entries should return False once the cache is marked unwritable."""
+        from src.cache.cache import CacheEntry, LocalCache
+        
+        cache = LocalCache(cache_dir=temp_cache_dir)
+        cache._writable = False
+        
+        assert cache.add_entries([CacheEntry(**sample_entry_data)]) is False
+
+
 class TestCacheGetRecent:
     """Tests for retrieving recent entries."""
 
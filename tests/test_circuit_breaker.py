@@ -119,6 +119,27 @@ class TestCircuitBreakerBasicState:
         
         assert cb.get_state(service) == "open"
 
+    def test_half_open_allows_single_probe(self):
+        """Test that half-open lets one request through until it reports back."""
+        from src.utils.circuit_breaker import CircuitBreaker
+        
+        cb = CircuitBreaker(failure_threshold=2, reset_timeout=0.1)
+        service = "browserless_unblock"
+        
+        # Open the circuit
+        cb.record_failure(service)
+        cb.record_failure(service)
+        
+        # Wait for reset timeout to enter half-open
+        time.sleep(0.15)
+        assert cb.allow_request(service) is True
+        
+        # Other callers are held back while the probe is in flight
+        assert cb.allow_request(service) is False
+        
+        cb.record_success(service)
+        assert cb.allow_request(service) is True
+
 
 class TestCircuitBreakerMultiService:
     """Tests for multi-service circuit breaker behavior."""
@@ -90,3 +90,10 @@ def test_all_settings_have_defaults():
         if has_env and os.path.exists(".env.tmp"):
             os.rename(".env.tmp", ".env")
 
+
+def test_browserless_max_concurrency_must_be_positive():
+    """Test that a zero in-flight /unblock limit is rejected instead of hanging requests."""
+    from src.config import Settings
+
+    with pytest.raises(ValidationError):
+        Settings(browserless_max_concurrency=0)
@@ -11,7 +11,6 @@ import ast
 import json
 import re
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 from unittest.mock import MagicMock, patch
 
@@ -23,13 +22,6 @@ import pytest
 # =============================================================================
 
 
-@pytest.fixture
-def streamlit_app_source():
-    """Load the streamlit_app.py source code for AST analysis."""
-    app_path = Path(__file__).parent.parent / "src" / "streamlit_app.py"
-    return app_path.read_text()
-
-
 @pytest.fixture
 def mock_session_state():
     """Create a mock session state dict that behaves like st.session_state."""
@@ -54,9 +46,12 @@ def mock_session_state():
     return MockSessionState()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_batch_results():
-    """Sample batch results for testing session state persistence."""
+    """Sample batch results for testing session state persistence.
+
+    Module-scoped so the models are built once; tests must not mutate them.
+    """
     from src.models.schemas import (
         ContentMetadata, 
         ContentSummary,
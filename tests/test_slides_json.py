@@ -5,10 +5,12 @@ and the unified quote/theme detection logic.
 """
 
 import json
+import re
 from datetime import datetime, timezone
 
 import pytest
 
+from src.export.slides_json import SlidesJSONGenerator
 from src.models.schemas import (
     AggregatedResult,
     AggregatedResultSet,
@@ -25,11 +27,50 @@ from src.models.schemas import (
 )
 
 
+# slides_MM_DD_YY.json
+_FILENAME_RE = re.compile(r"slides_\d{2}_\d{2}_\d{2}\.json")
+
+
 # ============================================================================
 # Test Fixtures
 # ============================================================================
 
 
+@pytest.fixture(scope="session")
+def slides_gen():
+    """Shared SlidesJSONGenerator (stateless after construction)."""
+    return SlidesJSONGenerator()
+
+
+@pytest.fixture(scope="session")
+def base_summary():
+    """Minimal ContentSummary shared by detection tests."""
+    return ContentSummary(
+        executive_summary="Test article.",
+        key_points=["Point"],
+        sentiment=Sentiment.NEUTRAL,
+    )
+
+
+@pytest.fixture
+def make_result(base_summary):
+    """Factory for completed ProcessedResults varying only url/footnotes."""
+    def _make(url="https://example.com/article", footnotes=None):
+        summary = (
+            base_summary.model_copy(update={"footnotes": footnotes})
+            if footnotes
+            else base_summary
+        )
+        return ProcessedResult(
+            url=url,
+            source_type=URLType.NEWS_ARTICLE,
+            status=ProcessingStatus.COMPLETED,
+            summary=summary,
+        )
+
+    return _make
+
+
 @pytest.fixture
 def sample_summary_with_slides():
     """Create sample summary with slide content."""
@@ -220,8 +261,6 @@ class TestSlidesJSONGenerator:
 
     def test_generator_creates_valid_json(self, processed_result_bullets):
         """Generator produces valid JSON string."""
-        from src.export.slides_json import SlidesJSONGenerator
-
         gen = SlidesJSONGenerator()
         output = gen.generate([processed_result_bullets])
 
@@ -233,8 +272,6 @@ class TestSlidesJSONGenerator:
 
     def test_generator_includes_all_slides(self, processed_result_bullets, processed_result_video):
         """Generator includes all processed results."""
-        from src.export.slides_json import SlidesJSONGenerator
-
         gen = SlidesJSONGenerator()
         output = gen.generate([processed_result_bullets, processed_result_video])
 
@@ -244,8 +281,6 @@ class TestSlidesJSONGenerator:
 
     def test_bullet_slide_structure(self, processed_result_bullets):
         """Bullet slide has correct structure."""
-        from src.export.slides_json import SlidesJSONGenerator
-
         gen = SlidesJSONGenerator()
         output = gen.generate([processed_result_bullets])
 
@@ -261,8 +296,6 @@ class TestSlidesJSONGenerator:
 
     def test_video_slide_detection(self, processed_result_video):
         """Video URLs are detected correctly."""
-        from src.export.slides_json import SlidesJSONGenerator
-
         gen = SlidesJSONGenerator()
         output = gen.generate([processed_result_video])
 
@@ -274,8 +307,6 @@ class TestSlidesJSONGenerator:
 
     def test_theme_grouping(self, processed_result_bullets):
         """Results are grouped by theme."""
-        from src.export.slides_json import SlidesJSONGenerator
-
         gen = SlidesJSONGenerator()
         output = gen.generate([processed_result_bullets])
 
@@ -286,8 +317,6 @@ class TestSlidesJSONGenerator:
 
     def test_aggregated_results(self, aggregated_result):
         """Aggregated results include source count."""
-        from src.export.slides_json import SlidesJSONGenerator
-
         gen = SlidesJSONGenerator()
         result_set = AggregatedResultSet(
             results=[aggregated_result],
@@ -314,89 +343,39 @@ class TestSlidesJSONGenerator:
 class TestQuoteDetectionConsistency:
     """Tests for unified quote detection logic."""
 
-    def test_quote_min_length_constant(self):
+    def test_quote_min_length_constant(self, slides_gen):
         """QUOTE_MIN_LENGTH constant exists and is consistent."""
-        from src.export.slides_json import SlidesJSONGenerator
-
-        gen = SlidesJSONGenerator()
-        assert hasattr(gen, "QUOTE_MIN_LENGTH")
-        assert gen.QUOTE_MIN_LENGTH == 30
+        assert hasattr(slides_gen, "QUOTE_MIN_LENGTH")
+        assert slides_gen.QUOTE_MIN_LENGTH == 30
 
-    def test_short_quote_not_detected(self):
+    def test_short_quote_not_detected(self, slides_gen, make_result):
         """Quotes shorter than threshold are not detected as quote slides."""
-        from src.export.slides_json import SlidesJSONGenerator
-
-        gen = SlidesJSONGenerator()
-
-        # Create result with short quote (< 30 chars)
-        result = ProcessedResult(
-            url="https://example.com/article",
-            source_type=URLType.NEWS_ARTICLE,
-            status=ProcessingStatus.COMPLETED,
-            summary=ContentSummary(
-                executive_summary="Test article.",
-                key_points=["Point"],
-                sentiment=Sentiment.NEUTRAL,
-                footnotes=[
-                    Footnote(id=1, source_text="Short quote", context="Person"),
-                ],
-            ),
-        )
+        result = make_result(footnotes=[
+            Footnote(id=1, source_text="Short quote", context="Person"),
+        ])
+        assert not slides_gen._has_quotable_content(result)
 
-        assert not gen._has_quotable_content(result)
-
-    def test_long_quote_with_context_detected(self):
+    def test_long_quote_with_context_detected(self, slides_gen, make_result):
         """Quotes longer than threshold with context are detected."""
-        from src.export.slides_json import SlidesJSONGenerator
-
-        gen = SlidesJSONGenerator()
-
-        # Create result with long quote (> 30 chars) with context
-        result = ProcessedResult(
-            url="https://example.com/article",
-            source_type=URLType.NEWS_ARTICLE,
-            status=ProcessingStatus.COMPLETED,
-            summary=ContentSummary(
-                executive_summary="Test article.",
-                key_points=["Point"],
-                sentiment=Sentiment.NEUTRAL,
-                footnotes=[
-                    Footnote(
-                        id=1,
-                        source_text="This is a much longer quote that exceeds thirty characters easily.",
-                        context="Famous Person, CEO",
-                    ),
-                ],
+        result = make_result(footnotes=[
+            Footnote(
+                id=1,
+                source_text="This is a much longer quote that exceeds thirty characters easily.",
+                context="Famous Person, CEO",
             ),
-        )
-
-        assert gen._has_quotable_content(result)
+        ])
+        assert slides_gen._has_quotable_content(result)
 
-    def test_long_quote_without_context_not_detected(self):
+    def test_long_quote_without_context_not_detected(self, slides_gen, make_result):
         """Quotes without context are not detected as quote slides."""
-        from src.export.slides_json import SlidesJSONGenerator
-
-        gen = SlidesJSONGenerator()
-
-        result = ProcessedResult(
-            url="https://example.com/article",
-            source_type=URLType.NEWS_ARTICLE,
-            status=ProcessingStatus.COMPLETED,
-            summary=ContentSummary(
-                executive_summary="Test article.",
-                key_points=["Point"],
-                sentiment=Sentiment.NEUTRAL,
-                footnotes=[
-                    Footnote(
-                        id=1,
-                        source_text="This is a much longer quote that exceeds thirty characters easily.",
-                        context="",  # Empty context
-                    ),
-                ],
+        result = make_result(footnotes=[
+            Footnote(
+                id=1,
+                source_text="This is a much longer quote that exceeds thirty characters easily.",
+                context="",  # Empty context
             ),
-        )
-
-        assert not gen._has_quotable_content(result)
+        ])
+        assert not slides_gen._has_quotable_content(result)
 
 
 # ============================================================================
@@ -407,12 +386,8 @@ class TestQuoteDetectionConsistency:
 class TestThemeDetectionConsistency:
     """Tests for unified theme detection logic."""
 
-    def test_word_boundary_matching(self):
+    def test_word_boundary_matching(self, slides_gen):
         """Theme detection uses word boundaries."""
-        from src.export.slides_json import SlidesJSONGenerator
-
-        gen = SlidesJSONGenerator()
-
         # "AI" should match, but not as part of "CHAIR"
         result_ai = AggregatedResult(
             title="AI Model Launch",
@@ -426,15 +401,11 @@ class TestThemeDetectionConsistency:
             original_count=1,
         )
 
-        theme = gen._detect_aggregated_theme(result_ai)
+        theme = slides_gen._detect_aggregated_theme(result_ai)
         assert theme == "AI Models & Product Launches"
 
-    def test_theme_from_topics(self):
+    def test_theme_from_topics(self, slides_gen):
         """Theme detected from topics list."""
-        from src.export.slides_json import SlidesJSONGenerator
-
-        gen = SlidesJSONGenerator()
-
         result = AggregatedResult(
             title="Industry News",
             sources=[SourceReference(url="https://example.com", site_name="Test")],
@@ -447,15 +418,11 @@ class TestThemeDetectionConsistency:
             original_count=1,
         )
 
-        theme = gen._detect_aggregated_theme(result)
+        theme = slides_gen._detect_aggregated_theme(result)
         assert theme == "AI Infrastructure & Hardware"
 
-    def test_default_theme_fallback(self):
+    def test_default_theme_fallback(self, slides_gen):
         """Falls back to default theme when no keywords match."""
-        from src.export.slides_json import SlidesJSONGenerator
-
-        gen = SlidesJSONGenerator()
-
         result = AggregatedResult(
             title="Unrelated News",
             sources=[SourceReference(url="https://example.com", site_name="Test")],
@@ -468,7 +435,7 @@ class TestThemeDetectionConsistency:
             original_count=1,
         )
 
-        theme = gen._detect_aggregated_theme(result)
+        theme = slides_gen._detect_aggregated_theme(result)
         assert theme == "Other AI News"
 
 
@@ -480,62 +447,17 @@ class TestThemeDetectionConsistency:
 class TestVideoURLDetection:
     """Tests for video URL detection."""
 
-    def test_youtube_detection(self):
-        """YouTube URLs are detected."""
-        from src.export.slides_json import SlidesJSONGenerator
-
-        gen = SlidesJSONGenerator()
-
-        result = ProcessedResult(
-            url="https://youtube.com/watch?v=abc123",
-            source_type=URLType.NEWS_ARTICLE,
-            status=ProcessingStatus.COMPLETED,
-            summary=ContentSummary(
-                executive_summary="Video content.",
-                key_points=["Point"],
-                sentiment=Sentiment.NEUTRAL,
-            ),
-        )
-
-        assert gen._has_video_content(result)
-
-    def test_vimeo_detection(self):
-        """Vimeo URLs are detected."""
-        from src.export.slides_json import SlidesJSONGenerator
-
-        gen = SlidesJSONGenerator()
-
-        result = ProcessedResult(
-            url="https://vimeo.com/123456",
-            source_type=URLType.NEWS_ARTICLE,
-            status=ProcessingStatus.COMPLETED,
-            summary=ContentSummary(
-                executive_summary="Video content.",
-                key_points=["Point"],
-                sentiment=Sentiment.NEUTRAL,
-            ),
-        )
-
-        assert gen._has_video_content(result)
-
-    def test_non_video_url(self):
-        """Non-video URLs are not detected as video."""
-        from src.export.slides_json import SlidesJSONGenerator
-
-        gen = SlidesJSONGenerator()
-
-        result = ProcessedResult(
-            url="https://blog.google/article",
-            source_type=URLType.NEWS_ARTICLE,
-            status=ProcessingStatus.COMPLETED,
-            summary=ContentSummary(
-                executive_summary="Article content.",
-                key_points=["Point"],
-                sentiment=Sentiment.NEUTRAL,
-            ),
-        )
-
-        assert not gen._has_video_content(result)
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            pytest.param("https://youtube.com/watch?v=abc123", True, id="youtube"),
+            pytest.param("https://vimeo.com/123456", True, id="vimeo"),
+            pytest.param("https://blog.google/article", False, id="non_video"),
+        ],
+    )
+    def test_video_detection(self, slides_gen, make_result, url, expected):
+        """Video URLs are detected; non-video URLs are not."""
+        assert slides_gen._has_video_content(make_result(url=url)) is expected
 
 
 # ============================================================================
@@ -546,15 +468,9 @@ class TestVideoURLDetection:
 class TestFilenameGeneration:
     """Tests for filename generation."""
 
-    def test_get_filename_format(self):
+    def test_get_filename_format(self, slides_gen):
         """Filename has expected format."""
-        from src.export.slides_json import SlidesJSONGenerator
-
-        gen = SlidesJSONGenerator()
-        filename = gen.get_filename()
+        filename = slides_gen.get_filename()
 
-        assert filename.startswith("slides_")
-        assert filename.endswith(".json")
         # Should contain date in MM_DD_YY format
-        parts = filename.replace("slides_", "").replace(".json", "").split("_")
-        assert len(parts) == 3
+        assert _FILENAME_RE.fullmatch(filename), filename
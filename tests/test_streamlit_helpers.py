@@ -1,173 +1,188 @@
 """Tests for Streamlit app helper functions."""
 
 import asyncio
-import pytest
-from unittest.mock import MagicMock, patch
-
-# Import the helper functions directly
-# Note: We import these before streamlit is imported to avoid st.set_page_config issues
-import sys
+from contextlib import nullcontext
 
-# Mock streamlit before importing the module
-sys.modules['streamlit'] = MagicMock()
+import pytest
 
-from src.streamlit_app import get_rating_color, get_sentiment_color, get_sentiment_emoji, run_async
-from src.models.schemas import Sentiment
+# streamlit is stubbed in conftest.py before this module is imported
+from src.streamlit_app import (
+    get_rating_color,
+    get_sentiment_color,
+    get_sentiment_emoji,
+    restore_batch_results,
+    run_async,
+    serialize_batch_results,
+)
+from src.models.schemas import (
+    ContentSummary,
+    ProcessedResult,
+    ProcessingStatus,
+    Sentiment,
+    URLType,
+)
 
 
 class TestGetRatingColor:
     """Tests for get_rating_color function."""
 
-    def test_true_is_green(self):
-        """Test that 'true' rating returns green."""
-        assert get_rating_color("true") == "green"
-
-    def test_mostly_true_is_green(self):
-        """Test that 'mostly_true' rating returns green."""
-        assert get_rating_color("mostly_true") == "green"
-
-    def test_false_is_red(self):
-        """Test that 'false' rating returns red."""
-        assert get_rating_color("false") == "red"
-
-    def test_mostly_false_is_red(self):
-        """Test that 'mostly_false' rating returns red."""
-        assert get_rating_color("mostly_false") == "red"
-
-    def test_mixed_is_orange(self):
-        """Test that 'mixed' rating returns orange."""
-        assert get_rating_color("mixed") == "orange"
-
-    def test_unverified_is_orange(self):
-        """Test that 'unverified' rating returns orange."""
-        assert get_rating_color("unverified") == "orange"
-
-    def test_insufficient_data_is_orange(self):
-        """Test that 'insufficient_data' rating returns orange."""
-        assert get_rating_color("insufficient_data") == "orange"
-
-    def test_empty_string_is_orange(self):
-        """Test that empty string returns orange."""
-        assert get_rating_color("") == "orange"
-
-    def test_none_handling(self):
-        """Test that None is handled gracefully."""
-        assert get_rating_color(None) == "orange"
-
-    def test_case_insensitive(self):
-        """Test that rating comparison is case-insensitive."""
-        assert get_rating_color("TRUE") == "green"
-        assert get_rating_color("False") == "red"
-        assert get_rating_color("MOSTLY_TRUE") == "green"
-
-    def test_whitespace_handling(self):
-        """Test that whitespace is stripped."""
-        assert get_rating_color("  true  ") == "green"
-        assert get_rating_color("\tfalse\n") == "red"
+    @pytest.mark.parametrize(
+        "rating,expected",
+        [
+            pytest.param("true", "green", id="true_is_green"),
+            pytest.param("mostly_true", "green", id="mostly_true_is_green"),
+            pytest.param("false", "red", id="false_is_red"),
+            pytest.param("mostly_false", "red", id="mostly_false_is_red"),
+            pytest.param("mixed", "orange", id="mixed_is_orange"),
+            pytest.param("unverified", "orange", id="unverified_is_orange"),
+            pytest.param("insufficient_data", "orange", id="insufficient_data_is_orange"),
+            pytest.param("", "orange", id="empty_string_is_orange"),
+            pytest.param(None, "orange", id="none_handling"),
+            pytest.param("TRUE", "green", id="case_insensitive_upper"),
+            pytest.param("False", "red", id="case_insensitive_title"),
+            pytest.param("MOSTLY_TRUE", "green", id="case_insensitive_mostly"),
+            pytest.param("  true  ", "green", id="whitespace_spaces"),
+            pytest.param("\tfalse\n", "red", id="whitespace_tab_newline"),
+        ],
+    )
+    def test_rating_color(self, rating, expected):
+        """Test rating-to-color mapping, including case and whitespace handling."""
+        assert get_rating_color(rating) == expected
 
 
 class TestGetSentimentColor:
     """Tests for get_sentiment_color function."""
 
-    def test_positive_is_green(self):
-        """Test that POSITIVE sentiment returns green."""
-        assert get_sentiment_color(Sentiment.POSITIVE) == "green"
-
-    def test_negative_is_red(self):
-        """Test that NEGATIVE sentiment returns red."""
-        assert get_sentiment_color(Sentiment.NEGATIVE) == "red"
-
-    def test_neutral_is_gray(self):
-        """Test that NEUTRAL sentiment returns gray."""
-        assert get_sentiment_color(Sentiment.NEUTRAL) == "gray"
-
-    def test_mixed_is_orange(self):
-        """Test that MIXED sentiment returns orange."""
-        assert get_sentiment_color(Sentiment.MIXED) == "orange"
-
-    def test_unknown_returns_gray(self):
-        """Test that unknown sentiment returns gray."""
-        assert get_sentiment_color(None) == "gray"
+    @pytest.mark.parametrize(
+        "sentiment,expected",
+        [
+            pytest.param(Sentiment.POSITIVE, "green", id="positive_is_green"),
+            pytest.param(Sentiment.NEGATIVE, "red", id="negative_is_red"),
+            pytest.param(Sentiment.NEUTRAL, "gray", id="neutral_is_gray"),
+            pytest.param(Sentiment.MIXED, "orange", id="mixed_is_orange"),
+            pytest.param(None, "gray", id="unknown_returns_gray"),
+        ],
+    )
+    def test_sentiment_color(self, sentiment, expected):
+        """Test sentiment-to-color mapping."""
+        assert get_sentiment_color(sentiment) == expected
 
 
 class TestGetSentimentEmoji:
     """Tests for get_sentiment_emoji function."""
 
-    def test_positive_emoji(self):
-        """Test that POSITIVE sentiment returns happy emoji."""
-        assert get_sentiment_emoji(Sentiment.POSITIVE) == "😊"
-
-    def test_negative_emoji(self):
-        """Test that NEGATIVE sentiment returns sad emoji."""
-        assert get_sentiment_emoji(Sentiment.NEGATIVE) == "😔"
-
-    def test_neutral_emoji(self):
-        """Test that NEUTRAL sentiment returns neutral emoji."""
-        assert get_sentiment_emoji(Sentiment.NEUTRAL) == "😐"
+    @pytest.mark.parametrize(
+        "sentiment,expected",
+        [
+            pytest.param(Sentiment.POSITIVE, "😊", id="positive_emoji"),
+            pytest.param(Sentiment.NEGATIVE, "😔", id="negative_emoji"),
+            pytest.param(Sentiment.NEUTRAL, "😐", id="neutral_emoji"),
+            pytest.param(Sentiment.MIXED, "🤔", id="mixed_emoji"),
+            pytest.param(None, "❓", id="unknown_returns_question"),
+        ],
+    )
+    def test_sentiment_emoji(self, sentiment, expected):
+        """Test sentiment-to-emoji mapping."""
+        assert get_sentiment_emoji(sentiment) == expected
 
-    def test_mixed_emoji(self):
-        """Test that MIXED sentiment returns thinking emoji."""
-        assert get_sentiment_emoji(Sentiment.MIXED) == "🤔"
 
-    def test_unknown_returns_question(self):
-        """Test that unknown sentiment returns question emoji."""
-        assert get_sentiment_emoji(None) == "❓"
+async def _simple_coro():
+    return 42
 
 
-class TestRunAsync:
-    """Tests for run_async helper function."""
-
-    def test_run_async_executes_coroutine(self):
-        """Test that run_async successfully executes a coroutine."""
-        async def simple_coro():
-            return 42
+async def _failing_coro():
+    raise ValueError("Test error")
 
-        result = run_async(simple_coro())
-        assert result == 42
 
-    def test_run_async_handles_exception(self):
-        """Test that run_async propagates exceptions."""
-        async def failing_coro():
-            raise ValueError("Test error")
+async def _returning_coro():
+    await asyncio.sleep(0.01)
+    return {"key": "value"}
 
-        with pytest.raises(ValueError, match="Test error"):
-            run_async(failing_coro())
 
-    def test_run_async_returns_async_result(self):
-        """Test that run_async returns the actual result."""
-        async def returning_coro():
-            await asyncio.sleep(0.01)
-            return {"key": "value"}
+class TestRunAsync:
+    """Tests for run_async helper function."""
 
-        result = run_async(returning_coro())
-        assert result == {"key": "value"}
+    @pytest.mark.parametrize(
+        "coro_factory,expected,expectation",
+        [
+            pytest.param(_simple_coro, 42, nullcontext(), id="executes_coroutine"),
+            pytest.param(
+                _failing_coro, None, pytest.raises(ValueError, match="Test error"),
+                id="propagates_exception",
+            ),
+            pytest.param(
+                _returning_coro, {"key": "value"}, nullcontext(), id="returns_async_result",
+            ),
+        ],
+    )
+    def test_run_async(self, coro_factory, expected, expectation):
+        """Test that run_async returns the coroutine's result or propagates its error."""
+        with expectation:
+            assert run_async(coro_factory()) == expected
+
+
+class TestBatchResultsRestoration:
+    """Tests for serializing and restoring cached batch results."""
+
+    @pytest.fixture
+    def batch_results(self):
+        return [
+            ProcessedResult(
+                url="https://example.com/article1",
+                source_type=URLType.NEWS_ARTICLE,
+                status=ProcessingStatus.COMPLETED,
+                summary=ContentSummary(
+                    executive_summary="Test summary",
+                    key_points=["Point 1"],
+                    sentiment=Sentiment.POSITIVE,
+                ),
+            ),
+            ProcessedResult(
+                url="https://example.com/article2",
+                source_type=URLType.NEWS_ARTICLE,
+                status=ProcessingStatus.FAILED,
+                error="Network timeout",
+            ),
+        ]
+
+    def test_round_trip_from_str(self, batch_results):
+        """Serialized results should restore to equal ProcessedResult objects."""
+        results_json = serialize_batch_results(batch_results)
+        assert isinstance(results_json, str)
+        assert restore_batch_results(results_json) == batch_results
+
+    def test_round_trip_from_bytes(self, batch_results):
+        """Restoration should accept raw bytes without decoding first."""
+        results_json = serialize_batch_results(batch_results).encode("utf-8")
+        restored = restore_batch_results(results_json)
+        assert restored == batch_results
+        assert restored[0].summary.sentiment is Sentiment.POSITIVE
+
+    def test_restores_legacy_json_dumps_format(self, batch_results):
+        """Batches cached with json.dumps(model_dump(mode='json')) still restore."""
+        import json
+
+        legacy = json.dumps([r.model_dump(mode="json") for r in batch_results])
+        assert restore_batch_results(legacy) == batch_results
 
 
 class TestHistoryBounding:
     """Tests for history bounding logic."""
 
-    def test_history_trimmed_to_100(self):
-        """Test that history list is trimmed to 100 items."""
+    @pytest.mark.parametrize(
+        "n,expected_len,first,last",
+        [
+            pytest.param(150, 100, 50, 149, id="trimmed_to_100"),
+            pytest.param(50, 50, 0, 49, id="not_trimmed_under_limit"),
+            pytest.param(0, 0, None, None, id="empty_stays_empty"),
+        ],
+    )
+    def test_history_trim(self, n, expected_len, first, last):
+        """Test that the history trim keeps only the newest 100 items."""
         # Simulate the history trimming logic
-        history = list(range(150))  # 150 items
-        history = history[-100:]
-        
-        assert len(history) == 100
-        assert history[0] == 50  # First 50 items removed
-        assert history[-1] == 149  # Last item preserved
-
-    def test_history_not_trimmed_when_under_limit(self):
-        """Test that history is not trimmed when under 100 items."""
-        history = list(range(50))  # 50 items
-        history = history[-100:]
-        
-        assert len(history) == 50
-
-    def test_history_empty_stays_empty(self):
-        """Test that empty history stays empty after trim."""
-        history = []
-        history = history[-100:]
-        
-        assert len(history) == 0
-
+        history = list(range(n))[-100:]
 
+        assert len(history) == expected_len
+        if expected_len:
+            assert history[0] == first
+            assert history[-1] == last
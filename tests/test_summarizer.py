@@ -1,5 +1,7 @@
 """Tests for LLM summarization."""
 
+from contextlib import nullcontext
+
 import pytest
 
 from src.models.schemas import (
@@ -10,6 +12,9 @@ from src.models.schemas import (
     Sentiment,
 )
 
+# Very long content for truncation tests, built once per module
+_LONG_CONTENT = "x" * 200_000
+
 
 class TestContentSummary:
     """Tests for ContentSummary model."""
@@ -34,23 +39,22 @@ class TestContentSummary:
         assert len(summary.key_points) == 3
         assert summary.sentiment == Sentiment.NEUTRAL
 
-    def test_minimum_key_points(self):
+    @pytest.mark.parametrize(
+        "key_points,expectation",
+        [
+            pytest.param(["Single point"], nullcontext(), id="one_point_ok"),
+            pytest.param([], pytest.raises(ValueError), id="no_points_rejected"),
+        ],
+    )
+    def test_minimum_key_points(self, key_points, expectation):
         """Test that at least one key point is required."""
-        # This should work with one key point
-        summary = ContentSummary(
-            executive_summary="Summary",
-            key_points=["Single point"],
-            sentiment=Sentiment.NEUTRAL,
-        )
-        assert len(summary.key_points) == 1
-
-        # This should fail with no key points
-        with pytest.raises(ValueError):
-            ContentSummary(
+        with expectation:
+            summary = ContentSummary(
                 executive_summary="Summary",
-                key_points=[],
+                key_points=key_points,
                 sentiment=Sentiment.NEUTRAL,
             )
+            assert summary.key_points == key_points
 
     def test_entity_types(self):
         """Test entity type handling."""
@@ -63,45 +67,47 @@ class TestContentSummary:
         assert entity.type == EntityType.PERSON
         assert entity.relevance == 0.9
 
-    def test_sentiment_values(self):
+    @pytest.mark.parametrize("sentiment", list(Sentiment))
+    def test_sentiment_values(self, sentiment):
         """Test sentiment enum values."""
-        for sentiment in [Sentiment.POSITIVE, Sentiment.NEGATIVE, 
-                         Sentiment.NEUTRAL, Sentiment.MIXED]:
-            summary = ContentSummary(
-                executive_summary="Test",
-                key_points=["Point"],
-                sentiment=sentiment,
-            )
-            assert summary.sentiment == sentiment
+        summary = ContentSummary(
+            executive_summary="Test",
+            key_points=["Point"],
+            sentiment=sentiment,
+        )
+        assert summary.sentiment is sentiment
 
 
-class TestSummarizer:
-    """Tests for the Summarizer class."""
+@pytest.fixture(scope="module")
+def summarizer():
+    """Summarizer instance built without connecting to the API.
 
-    def test_content_truncation(self):
-        """Test content truncation for token limits."""
+    Skips dependent tests only if the summarizer module itself can't be
+    imported; bugs in the methods under test still fail normally.
+    """
+    try:
         from src.summarizer.llm import Summarizer
+    except ImportError as e:
+        pytest.skip(f"Summarizer unavailable: {e}")
 
-        # Create summarizer without actually connecting to API
-        try:
-            summarizer = Summarizer.__new__(Summarizer)
-            summarizer.api_key = "test"
-            summarizer.model_name = "test"
+    summarizer = Summarizer.__new__(Summarizer)
+    summarizer.api_key = "test"
+    summarizer.model_name = "test"
+    return summarizer
 
-            # Test truncation
-            long_content = "x" * 200000  # Very long content
-            truncated = summarizer._truncate_content(long_content, max_tokens=1000)
 
-            # Should be truncated
-            assert len(truncated) < len(long_content)
-            assert "[Content truncated" in truncated
+class TestSummarizer:
+    """Tests for the Summarizer class."""
 
-            # Short content should not be truncated
-            short_content = "This is short content."
-            result = summarizer._truncate_content(short_content, max_tokens=1000)
-            assert result == short_content
+    def test_content_truncation(self, summarizer):
+        """Test content truncation for token limits."""
+        truncated = summarizer._truncate_content(_LONG_CONTENT, max_tokens=1000)
 
-        except Exception:
-            # Skip if we can't create the summarizer
-            pytest.skip("Could not create Summarizer instance")
+        # Should be truncated
+        assert len(truncated) < len(_LONG_CONTENT)
+        assert "[Content truncated" in truncated
 
+        # Short content should not be truncated
+        short_content = "This is short content."
+        result = summarizer._truncate_content(short_content, max_tokens=1000)
+        assert result == short_content
@@ -1,10 +1,116 @@
 """Tests for the UnblockExtractor class using Browserless /unblock API."""
 
+import asyncio
+import json
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
 
 from src.extractors.base import ExtractionError
+from src.extractors.unblock import HTTP2_AVAILABLE, UnblockExtractor, _parse_retry_after
+from src.models.schemas import ExtractedContent
+from src.utils.circuit_breaker import get_fallback_circuit_breaker
+
+
+# Settings every test starts from; tests override attributes on `settings`
+_DEFAULT_SETTINGS = {
+    "browserless_api_key": "test_key",
+    "extraction_timeout": 30,
+    "browserless_use_residential_proxy": False,
+    "browserless_max_concurrency": 20,
+}
+
+# Key used by the error tests to check it never reaches error messages
+_SECRET_API_KEY = "super_secret_browserless_key_12345"
+
+
+# /unblock page body fed to extract(); parsed by trafilatura
+_ARTICLE_HTML_WITH_META = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Breaking News: Important Event</title>
+    <meta name="author" content="John Doe">
+    <meta property="article:published_time" content="2024-01-15T10:30:00Z">
+</head>
+<body>
+    <article>
+        <h1>Breaking News: Important Event</h1>
+        <p>This is a comprehensive news article about an important event
+        that happened recently. The article provides detailed coverage
+        of all the relevant facts and context.</p>
+        <p>Additional paragraphs provide more information about the topic,
+        including quotes from experts and background information.</p>
+    </article>
+</body>
+</html>
+"""
+
+
+def _response(status=200, json_body=None, text="", headers=None):
+    """Build a mocked /unblock HTTP response."""
+    if json_body is None:
+        json_body = {"content": "<html>test</html>"}
+    # Plain namespace: fetch_content only reads these four attributes
+    return SimpleNamespace(
+        status_code=status,
+        text=text,
+        headers=httpx.Headers(headers),
+        content=json.dumps(json_body).encode(),
+    )
+
+
+@pytest.fixture(scope="module")
+def unblock_settings():
+    """Settings object returned by get_settings for the whole module."""
+    mock_settings = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.extractors.unblock.get_settings", lambda: mock_settings)
+        yield mock_settings
+
+
+@pytest.fixture
+def settings(unblock_settings):
+    """Module settings, reset to defaults for each test."""
+    unblock_settings.configure_mock(**_DEFAULT_SETTINGS)
+    return unblock_settings
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breaker():
+    """Keep failures recorded by one test from opening the circuit for the next."""
+    get_fallback_circuit_breaker().reset()
+    yield
+    get_fallback_circuit_breaker().reset()
+
+
+@pytest.fixture
+def extractor(settings):
+    """UnblockExtractor built from the default patched settings."""
+    return UnblockExtractor()
+
+
+@pytest.fixture
+def mock_http(extractor):
+    """Factory that points an extractor's HTTP client at a mocked response.
+
+    Returns (client, response). Pass side_effect to raise or to return a
+    sequence of responses, and target to mock an extractor other than the
+    default fixture.
+    """
+    def _make(
+        status=200, json_body=None, text="", headers=None, side_effect=None, target=None
+    ):
+        response = _response(status, json_body, text, headers)
+        client = AsyncMock()
+        client.post = AsyncMock(return_value=response, side_effect=side_effect)
+        # Extractors are per-test, so a plain instance attribute needs no undo
+        (target or extractor).get_client = AsyncMock(return_value=client)
+        return client, response
+
+    return _make
 
 
 # =============================================================================
@@ -16,295 +122,336 @@ class TestUnblockExtractorBasicAPI:
     """Tests for basic /unblock API functionality."""
 
     @pytest.mark.asyncio
-    async def test_fetch_content_calls_correct_endpoint(self):
+    async def test_fetch_content_calls_correct_endpoint(self, settings, mock_http):
         """Test that fetch_content calls the correct Browserless /unblock endpoint."""
-        from src.extractors.unblock import UnblockExtractor
-
         api_key = "test_api_key"
         test_url = "https://example.com/article"
+        settings.browserless_api_key = api_key
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = api_key
-            mock_settings.return_value.extraction_timeout = 30
-
-            extractor = UnblockExtractor()
-
-            # Mock the httpx client
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
+        extractor = UnblockExtractor()
+        mock_client, _ = mock_http(
+            json_body={
                 "content": "<html><body>Test content</body></html>",
                 "cookies": [],
                 "screenshot": None,
                 "browserWSEndpoint": None,
-            }
+            },
+            target=extractor,
+        )
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+        await extractor.fetch_content(test_url)
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                html = await extractor.fetch_content(test_url)
+        # Verify the correct endpoint was called
+        mock_client.post.assert_called_once()
+        call_args = mock_client.post.call_args
+        endpoint_url = call_args.args[0]
+        assert "production-sfo.browserless.io/unblock" in endpoint_url
+        assert f"token={api_key}" in endpoint_url
 
-                # Verify the correct endpoint was called
-                call_args = mock_client.post.call_args
-                endpoint_url = call_args[0][0]
-                assert "production-sfo.browserless.io/unblock" in endpoint_url
-                assert f"token={api_key}" in endpoint_url
-
-                # Verify the payload
-                payload = call_args[1]["json"]
-                assert payload["url"] == test_url
-                assert payload["content"] is True
+        # Verify the payload
+        payload = call_args.kwargs["json"]
+        assert payload["url"] == test_url
+        assert payload["content"] is True
 
     @pytest.mark.asyncio
-    async def test_fetch_content_returns_html(self):
+    async def test_fetch_content_returns_html(self, extractor, mock_http):
         """Test that fetch_content returns the HTML content from the API response."""
-        from src.extractors.unblock import UnblockExtractor
-
         expected_html = "<html><body><h1>Article Title</h1><p>Article content here.</p></body></html>"
+        mock_http(json_body={
+            "content": expected_html,
+            "cookies": [],
+            "screenshot": None,
+            "browserWSEndpoint": None,
+        })
+
+        html = await extractor.fetch_content("https://example.com")
+
+        assert html == expected_html
+
+    @pytest.mark.parametrize(
+        "status,json_body,side_effect,expected",
+        [
+            pytest.param(400, None, None, "400", id="4xx"),
+            pytest.param(500, None, None, "500", id="5xx"),
+            pytest.param(
+                200, None, httpx.TimeoutException("Request timed out"), "timed out",
+                id="timeout",
+            ),
+            pytest.param(200, {"content": ""}, None, "empty", id="empty-content"),
+            pytest.param(200, {"content": None}, None, "empty", id="null-content"),
+            pytest.param(
+                200,
+                None,
+                httpx.HTTPError(
+                    "Connection failed to https://production-sfo.browserless.io"
+                    f"/unblock?token={_SECRET_API_KEY}"
+                ),
+                "[redacted]",
+                id="http-error-redacts-key",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_fetch_content_errors(
+        self, settings, mock_http, status, json_body, side_effect, expected
+    ):
+        """Test that failed requests raise ExtractionError without leaking the API key."""
+        settings.browserless_api_key = _SECRET_API_KEY
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
+        extractor = UnblockExtractor()
+        mock_http(
+            status=status,
+            json_body=json_body,
+            text="Error",
+            side_effect=side_effect,
+            target=extractor,
+        )
 
-            extractor = UnblockExtractor()
+        with pytest.raises(ExtractionError) as exc_info:
+            await extractor.fetch_content("https://example.com")
 
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "content": expected_html,
-                "cookies": [],
-                "screenshot": None,
-                "browserWSEndpoint": None,
-            }
+        error_message = str(exc_info.value)
+        assert expected in error_message.lower()
+        assert _SECRET_API_KEY not in error_message
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+    @pytest.mark.asyncio
+    async def test_fetch_content_without_orjson(self, extractor, mock_http):
+        """Test that responses still parse when orjson is not installed."""
+        mock_http()
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                html = await extractor.fetch_content("https://example.com")
+        with patch("src.extractors.unblock.orjson", None):
+            html = await extractor.fetch_content("https://example.com")
 
-                assert html == expected_html
+        assert html == "<html>test</html>"
 
     @pytest.mark.asyncio
-    async def test_fetch_content_handles_4xx_error(self):
-        """Test that 4xx errors raise ExtractionError."""
-        from src.extractors.unblock import UnblockExtractor
-
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
+    async def test_raises_error_when_no_api_key(self, settings):
+        """Test that ExtractionError is raised when no API key is configured."""
+        settings.browserless_api_key = None
 
-            extractor = UnblockExtractor()
+        extractor = UnblockExtractor()
 
-            mock_response = MagicMock()
-            mock_response.status_code = 400
-            mock_response.text = "Bad Request"
+        with pytest.raises(ExtractionError) as exc_info:
+            await extractor.fetch_content("https://example.com")
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+        assert "api key" in str(exc_info.value).lower()
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                with pytest.raises(ExtractionError) as exc_info:
-                    await extractor.fetch_content("https://example.com")
 
-                assert "400" in str(exc_info.value)
+class TestUnblockExtractorCanHandle:
+    """Tests for URL handling capability."""
 
-    @pytest.mark.asyncio
-    async def test_fetch_content_handles_5xx_error(self):
-        """Test that 5xx errors raise ExtractionError."""
-        from src.extractors.unblock import UnblockExtractor
+    def test_can_handle_http_url(self, extractor):
+        """Test that HTTP URLs are handled."""
+        assert extractor.can_handle("http://example.com/article") is True
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
+    def test_can_handle_https_url(self, extractor):
+        """Test that HTTPS URLs are handled."""
+        assert extractor.can_handle("https://example.com/article") is True
 
-            extractor = UnblockExtractor()
+    def test_cannot_handle_ftp_url(self, extractor):
+        """Test that FTP URLs are not handled."""
+        assert extractor.can_handle("ftp://example.com/file") is False
 
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_response.text = "Internal Server Error"
+    def test_cannot_handle_invalid_url(self, extractor):
+        """Test that invalid URLs return False."""
+        assert extractor.can_handle("not-a-url") is False
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                with pytest.raises(ExtractionError) as exc_info:
-                    await extractor.fetch_content("https://example.com")
+class TestUnblockExtractorClient:
+    """Tests for the pooled HTTP client lifecycle."""
 
-                assert "500" in str(exc_info.value)
+    @pytest.mark.asyncio
+    async def test_get_client_reuses_client(self, extractor):
+        """Test that repeated fetches share one pooled client."""
+        try:
+            assert await extractor.get_client() is await extractor.get_client()
+        finally:
+            await extractor.close()
 
     @pytest.mark.asyncio
-    async def test_fetch_content_handles_timeout(self):
-        """Test that timeouts are handled gracefully."""
-        from src.extractors.unblock import UnblockExtractor
+    async def test_client_uses_http2_when_available(self, extractor):
+        """Test that the pooled client negotiates HTTP/2 if h2 is installed."""
+        with patch("src.extractors.base.httpx.AsyncClient") as mock_client_cls:
+            await extractor.get_client()
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
+        assert mock_client_cls.call_args.kwargs["http2"] is HTTP2_AVAILABLE
 
-            extractor = UnblockExtractor()
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_client(self, extractor):
+        """Test that leaving the async context closes the client."""
+        async with extractor:
+            client = await extractor.get_client()
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(
-                side_effect=httpx.TimeoutException("Request timed out")
-            )
+        assert client.is_closed
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                with pytest.raises(ExtractionError) as exc_info:
-                    await extractor.fetch_content("https://example.com")
 
-                assert "timed out" in str(exc_info.value).lower()
+class TestUnblockExtractorConcurrency:
+    """Tests for the in-flight request limit."""
 
     @pytest.mark.asyncio
-    async def test_api_key_not_leaked_in_errors(self):
-        """Test that API key is never exposed in error messages."""
-        from src.extractors.unblock import UnblockExtractor
+    async def test_concurrent_fetches_respect_limit(self, settings, mock_http):
+        """Test that no more than browserless_max_concurrency requests run at once."""
+        settings.browserless_max_concurrency = 3
+        extractor = UnblockExtractor()
 
-        api_key = "super_secret_browserless_key_12345"
+        in_flight = 0
+        peak = 0
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = api_key
-            mock_settings.return_value.extraction_timeout = 30
+        async def slow_post(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _response()
 
-            extractor = UnblockExtractor()
+        mock_client, _ = mock_http(side_effect=slow_post, target=extractor)
 
-            # Simulate an error that might include the API key
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(
-                side_effect=httpx.HTTPError(
-                    f"Connection failed to https://production-sfo.browserless.io/unblock?token={api_key}"
-                )
-            )
+        await asyncio.gather(
+            *(extractor.fetch_content(f"https://example.com/{i}") for i in range(20))
+        )
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                with pytest.raises(ExtractionError) as exc_info:
-                    await extractor.fetch_content("https://example.com")
-
-                error_message = str(exc_info.value)
-                assert api_key not in error_message
+        assert mock_client.post.call_count == 20
+        assert peak == 3
 
     @pytest.mark.asyncio
-    async def test_fetch_content_handles_empty_response(self):
-        """Test that empty content in response raises ExtractionError."""
-        from src.extractors.unblock import UnblockExtractor
-
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
-
-            extractor = UnblockExtractor()
+    async def test_zero_concurrency_does_not_block(self, settings, mock_http):
+        """Test that a non-positive browserless_max_concurrency still lets requests run."""
+        settings.browserless_max_concurrency = 0
+        extractor = UnblockExtractor()
+        mock_client, _ = mock_http(target=extractor)
 
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "content": "",
-                "cookies": [],
-                "screenshot": None,
-                "browserWSEndpoint": None,
-            }
+        html = await asyncio.wait_for(extractor.fetch_content("https://example.com"), 1)
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+        assert html == "<html>test</html>"
+        mock_client.post.assert_called_once()
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                with pytest.raises(ExtractionError) as exc_info:
-                    await extractor.fetch_content("https://example.com")
 
-                assert "empty" in str(exc_info.value).lower()
+class TestUnblockExtractorCache:
+    """Tests for reusing fetched HTML across repeat requests."""
 
     @pytest.mark.asyncio
-    async def test_fetch_content_handles_null_content(self):
-        """Test that null content in response raises ExtractionError."""
-        from src.extractors.unblock import UnblockExtractor
+    async def test_repeat_fetch_uses_cache(self, extractor, mock_http):
+        """Test that fetching the same URL twice makes one API call."""
+        mock_client, _ = mock_http()
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
+        first = await extractor.fetch_content("https://example.com")
+        second = await extractor.fetch_content("https://example.com")
 
-            extractor = UnblockExtractor()
+        assert first == second == "<html>test</html>"
+        mock_client.post.assert_called_once()
 
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "content": None,
-                "cookies": [],
-                "screenshot": None,
-                "browserWSEndpoint": None,
-            }
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_request(self, extractor, mock_http):
+        """Test that concurrent fetches of one URL are coalesced."""
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return _response()
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+        mock_client, _ = mock_http(side_effect=slow_post)
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                with pytest.raises(ExtractionError) as exc_info:
-                    await extractor.fetch_content("https://example.com")
+        results = await asyncio.gather(
+            *(extractor.fetch_content("https://example.com") for _ in range(5))
+        )
 
-                assert "empty" in str(exc_info.value).lower() or "content" in str(exc_info.value).lower()
+        assert results == ["<html>test</html>"] * 5
+        mock_client.post.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_raises_error_when_no_api_key(self):
-        """Test that ExtractionError is raised when no API key is configured."""
-        from src.extractors.unblock import UnblockExtractor
-
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = None
-            mock_settings.return_value.extraction_timeout = 30
+    async def test_cancelling_first_caller_keeps_shared_request(
+        self, extractor, mock_http
+    ):
+        """Test that cancelling the caller that started a fetch spares its waiters."""
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return _response()
+
+        mock_client, _ = mock_http(side_effect=slow_post)
+
+        first = asyncio.ensure_future(extractor.fetch_content("https://example.com"))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(extractor.fetch_content("https://example.com"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "<html>test</html>"
+        assert first.cancelled()
+        mock_client.post.assert_called_once()
+        # The finished request is still cached for later callers
+        assert await extractor.fetch_content("https://example.com") == "<html>test</html>"
+        mock_client.post.assert_called_once()
 
-            extractor = UnblockExtractor()
+    @pytest.mark.asyncio
+    async def test_joined_fetch_respects_own_timeout(self, extractor, mock_http):
+        """Test that joining a longer in-flight fetch doesn't outlast the caller's timeout."""
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.2)
+            return _response()
 
-            with pytest.raises(ExtractionError) as exc_info:
-                await extractor.fetch_content("https://example.com")
+        mock_client, _ = mock_http(side_effect=slow_post)
 
-            assert "api key" in str(exc_info.value).lower()
+        first = asyncio.ensure_future(
+            extractor.fetch_content("https://example.com", timeout=1.0)
+        )
+        await asyncio.sleep(0)
 
+        with pytest.raises(ExtractionError, match="timed out"):
+            await extractor.fetch_content("https://example.com", timeout=0.05)
 
-class TestUnblockExtractorCanHandle:
-    """Tests for URL handling capability."""
+        assert not first.done()
+        assert await first == "<html>test</html>"
+        mock_client.post.assert_called_once()
 
-    def test_can_handle_http_url(self):
-        """Test that HTTP URLs are handled."""
-        from src.extractors.unblock import UnblockExtractor
+    @pytest.mark.asyncio
+    async def test_wait_options_are_part_of_cache_key(self, extractor, mock_http):
+        """Test that different waitFor options are fetched separately."""
+        mock_client, _ = mock_http()
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
+        await extractor.fetch_content("https://example.com")
+        await extractor.fetch_content("https://example.com", wait_for_selector="article")
 
-            extractor = UnblockExtractor()
-            assert extractor.can_handle("http://example.com/article") is True
+        assert mock_client.post.call_count == 2
 
-    def test_can_handle_https_url(self):
-        """Test that HTTPS URLs are handled."""
-        from src.extractors.unblock import UnblockExtractor
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self, extractor, mock_http):
+        """Test that entries older than CACHE_TTL are fetched again."""
+        extractor.CACHE_TTL = 0
+        mock_client, _ = mock_http()
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
+        await extractor.fetch_content("https://example.com")
+        await extractor.fetch_content("https://example.com")
 
-            extractor = UnblockExtractor()
-            assert extractor.can_handle("https://example.com/article") is True
+        assert mock_client.post.call_count == 2
+        assert len(extractor._html_cache) == 1
 
-    def test_cannot_handle_ftp_url(self):
-        """Test that FTP URLs are not handled."""
-        from src.extractors.unblock import UnblockExtractor
+    @pytest.mark.asyncio
+    async def test_cache_evicts_oldest_past_max_entries(self, extractor, mock_http):
+        """Test that the cache holds at most CACHE_MAX_ENTRIES pages."""
+        extractor.CACHE_MAX_ENTRIES = 2
+        mock_client, _ = mock_http()
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
+        for path in ("a", "b", "c"):
+            await extractor.fetch_content(f"https://example.com/{path}")
+        await extractor.fetch_content("https://example.com/c")
+        await extractor.fetch_content("https://example.com/a")
 
-            extractor = UnblockExtractor()
-            assert extractor.can_handle("ftp://example.com/file") is False
+        assert len(extractor._html_cache) == 2
+        # c was still cached; a had been evicted and is fetched again
+        assert mock_client.post.call_count == 4
 
-    def test_cannot_handle_invalid_url(self):
-        """Test that invalid URLs return False."""
-        from src.extractors.unblock import UnblockExtractor
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, extractor, mock_http):
+        """Test that a failed fetch is retried on the next call."""
+        mock_client, _ = mock_http(side_effect=[
+            _response(503, text="Service Unavailable"),
+            _response(),
+        ])
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
+        with pytest.raises(ExtractionError):
+            await extractor.fetch_content("https://example.com")
 
-            extractor = UnblockExtractor()
-            assert extractor.can_handle("not-a-url") is False
+        assert await extractor.fetch_content("https://example.com") == "<html>test</html>"
+        assert mock_client.post.call_count == 2
 
 
 # =============================================================================
@@ -312,290 +459,120 @@ class TestUnblockExtractorCanHandle:
 # =============================================================================
 
 
-class TestUnblockExtractorExtract:
-    """Tests for the extract() method with trafilatura integration."""
-
-    @pytest.mark.asyncio
-    async def test_extract_parses_html_with_trafilatura(self):
-        """Test that extract() parses HTML content using trafilatura."""
-        from src.extractors.unblock import UnblockExtractor
-
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <head><title>Test Article Title</title></head>
-        <body>
-            <article>
-                <h1>Test Article Title</h1>
-                <p>This is the first paragraph of the article content.</p>
-                <p>This is the second paragraph with more meaningful text to ensure
-                trafilatura extracts it properly. We need enough content here.</p>
-                <p>The article continues with additional paragraphs to meet the
-                minimum content threshold for extraction.</p>
-            </article>
-        </body>
-        </html>
-        """
-
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
-
-            extractor = UnblockExtractor()
-
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"content": html_content}
-
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                result = await extractor.extract("https://example.com/article")
-
-                # Verify we got an ExtractedContent object
-                from src.models.schemas import ExtractedContent
-                assert isinstance(result, ExtractedContent)
-
-                # Verify the content was extracted (not raw HTML)
-                assert "<html>" not in result.raw_text
-                assert "paragraph" in result.raw_text.lower() or "content" in result.raw_text.lower()
-
-    @pytest.mark.asyncio
-    async def test_extract_extracts_metadata(self):
-        """Test that extract() extracts metadata from HTML."""
-        from src.extractors.unblock import UnblockExtractor
-
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Breaking News: Important Event</title>
-            <meta name="author" content="John Doe">
-            <meta property="article:published_time" content="2024-01-15T10:30:00Z">
-        </head>
-        <body>
-            <article>
-                <h1>Breaking News: Important Event</h1>
-                <p>This is a comprehensive news article about an important event
-                that happened recently. The article provides detailed coverage
-                of all the relevant facts and context.</p>
-                <p>Additional paragraphs provide more information about the topic,
-                including quotes from experts and background information.</p>
-            </article>
-        </body>
-        </html>
-        """
-
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
-
-            extractor = UnblockExtractor()
-
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"content": html_content}
-
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                result = await extractor.extract("https://example.com/article")
-
-                # Verify metadata was extracted
-                assert result.metadata is not None
-                # Title should be extracted
-                assert result.metadata.title is not None or "Breaking News" in result.raw_text
-
-    @pytest.mark.asyncio
-    async def test_extract_sets_extraction_method(self):
-        """Test that extract() sets the correct extraction method."""
-        from src.extractors.unblock import UnblockExtractor
-
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <body>
-            <article>
-                <h1>Article Title</h1>
-                <p>Sufficient content for extraction to succeed with trafilatura.
-                We need multiple paragraphs of meaningful text here.</p>
-                <p>More content to ensure the extraction threshold is met.</p>
-            </article>
-        </body>
-        </html>
-        """
+@pytest.fixture(scope="module")
+def extracted_article(unblock_settings):
+    """Result of a single extract() run over _ARTICLE_HTML_WITH_META.
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
+    trafilatura dominates this module's runtime, so the extract() tests
+    share one parse instead of running it per test.
+    """
+    unblock_settings.configure_mock(**_DEFAULT_SETTINGS)
+    extractor = UnblockExtractor()
+    client = AsyncMock()
+    client.post = AsyncMock(
+        return_value=_response(json_body={"content": _ARTICLE_HTML_WITH_META})
+    )
+    extractor.get_client = AsyncMock(return_value=client)
+    return asyncio.run(extractor.extract("https://example.com/article"))
 
-            extractor = UnblockExtractor()
 
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"content": html_content}
+class TestUnblockExtractorExtract:
+    """Tests for the extract() method with trafilatura integration."""
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+    def test_extract_parses_html_with_trafilatura(self, extracted_article):
+        """Test that extract() parses HTML content using trafilatura."""
+        # Verify we got an ExtractedContent object
+        assert isinstance(extracted_article, ExtractedContent)
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                result = await extractor.extract("https://example.com/article")
+        # Verify the content was extracted (not raw HTML)
+        raw_text = extracted_article.raw_text
+        assert "<html>" not in raw_text
+        assert "paragraph" in raw_text.lower() or "content" in raw_text.lower()
 
-                assert result.extraction_method == "browserless_unblock"
+    def test_extract_extracts_metadata(self, extracted_article):
+        """Test that extract() extracts metadata from HTML."""
+        # Verify metadata was extracted
+        assert extracted_article.metadata is not None
+        # Title should be extracted
+        assert (
+            extracted_article.metadata.title is not None
+            or "Breaking News" in extracted_article.raw_text
+        )
+
+    def test_extract_sets_extraction_method(self, extracted_article):
+        """Test that extract() sets the correct extraction method."""
+        assert extracted_article.extraction_method == "browserless_unblock"
 
-    @pytest.mark.asyncio
-    async def test_extract_sets_fallback_used_flag(self):
+    def test_extract_sets_fallback_used_flag(self, extracted_article):
         """Test that extract() sets fallback_used to True."""
-        from src.extractors.unblock import UnblockExtractor
-
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <body>
-            <article>
-                <h1>Article Title</h1>
-                <p>Content that is sufficient for extraction.</p>
-                <p>Additional content paragraphs for the test.</p>
-            </article>
-        </body>
-        </html>
-        """
-
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
-
-            extractor = UnblockExtractor()
-
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"content": html_content}
-
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                result = await extractor.extract("https://example.com/article")
-
-                assert result.fallback_used is True
+        assert extracted_article.fallback_used is True
 
 
 class TestUnblockExtractorResidentialProxy:
     """Tests for residential proxy configuration."""
 
     @pytest.mark.asyncio
-    async def test_residential_proxy_added_when_configured(self):
+    async def test_residential_proxy_added_when_configured(self, settings, mock_http):
         """Test that residential proxy parameter is added when configured."""
-        from src.extractors.unblock import UnblockExtractor
-
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
-            mock_settings.return_value.browserless_use_residential_proxy = True
-
-            extractor = UnblockExtractor()
+        settings.browserless_use_residential_proxy = True
 
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"content": "<html>content</html>"}
-
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+        extractor = UnblockExtractor()
+        mock_client, _ = mock_http(
+            json_body={"content": "<html>content</html>"}, target=extractor
+        )
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                await extractor.fetch_content("https://example.com")
+        await extractor.fetch_content("https://example.com")
 
-                call_args = mock_client.post.call_args
-                endpoint_url = call_args[0][0]
-                # Check if proxy=residential is in the URL
-                assert "proxy=residential" in endpoint_url
+        mock_client.post.assert_called_once()
+        call_args = mock_client.post.call_args
+        endpoint_url = call_args.args[0]
+        # Check if proxy=residential is in the URL
+        assert "proxy=residential" in endpoint_url
 
     @pytest.mark.asyncio
-    async def test_no_proxy_when_not_configured(self):
+    async def test_no_proxy_when_not_configured(self, extractor, mock_http):
         """Test that no proxy parameter is added when not configured."""
-        from src.extractors.unblock import UnblockExtractor
+        mock_client, _ = mock_http(json_body={"content": "<html>content</html>"})
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
-            mock_settings.return_value.browserless_use_residential_proxy = False
+        await extractor.fetch_content("https://example.com")
 
-            extractor = UnblockExtractor()
-
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"content": "<html>content</html>"}
-
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                await extractor.fetch_content("https://example.com")
-
-                call_args = mock_client.post.call_args
-                endpoint_url = call_args[0][0]
-                # Check that proxy parameter is NOT in the URL
-                assert "proxy=" not in endpoint_url
+        mock_client.post.assert_called_once()
+        call_args = mock_client.post.call_args
+        endpoint_url = call_args.args[0]
+        # Check that proxy parameter is NOT in the URL
+        assert "proxy=" not in endpoint_url
 
 
 class TestUnblockExtractorTimeout:
     """Tests for timeout configuration."""
 
-    @pytest.mark.asyncio
-    async def test_respects_extraction_timeout_from_settings(self):
+    def test_respects_extraction_timeout_from_settings(self, settings):
         """Test that the extractor uses timeout from settings."""
-        from src.extractors.unblock import UnblockExtractor
+        settings.extraction_timeout = 45
 
-        custom_timeout = 45
-
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = custom_timeout
-
-            extractor = UnblockExtractor()
+        extractor = UnblockExtractor()
 
-            assert extractor.timeout == custom_timeout
+        assert extractor.timeout == 45
 
     @pytest.mark.asyncio
-    async def test_timeout_passed_to_request(self):
+    async def test_timeout_passed_to_request(self, settings, mock_http):
         """Test that timeout is passed to the HTTP request."""
-        from src.extractors.unblock import UnblockExtractor
-
         custom_timeout = 45
+        settings.extraction_timeout = custom_timeout
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = custom_timeout
-            mock_settings.return_value.browserless_use_residential_proxy = False
-
-            extractor = UnblockExtractor()
-
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"content": "<html>test</html>"}
-
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+        extractor = UnblockExtractor()
+        mock_client, _ = mock_http(target=extractor)
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                await extractor.fetch_content("https://example.com")
+        await extractor.fetch_content("https://example.com")
 
-                call_args = mock_client.post.call_args
-                assert call_args[1]["timeout"] == custom_timeout
+        mock_client.post.assert_called_once()
+        assert mock_client.post.call_args.kwargs["timeout"] == custom_timeout
 
-    def test_custom_timeout_overrides_settings(self):
+    def test_custom_timeout_overrides_settings(self, settings):
         """Test that custom timeout in constructor overrides settings."""
-        from src.extractors.unblock import UnblockExtractor
+        extractor = UnblockExtractor(timeout=60)
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
-
-            extractor = UnblockExtractor(timeout=60)
-
-            assert extractor.timeout == 60
+        assert extractor.timeout == 60
 
 
 # =============================================================================
@@ -607,227 +584,367 @@ class TestUnblockExtractorRetryLogic:
     """Tests for retry logic on transient failures."""
 
     @pytest.mark.asyncio
-    async def test_retries_on_5xx_error(self):
+    async def test_retries_on_5xx_error(self, extractor, mock_http):
         """Test that 5xx errors trigger retry."""
-        from src.extractors.unblock import UnblockExtractor
+        # First call fails with 503, second succeeds
+        mock_client, _ = mock_http(side_effect=[
+            _response(503, text="Service Unavailable"),
+            _response(json_body={"content": "<html>test</html>"}),
+        ])
+
+        html = await extractor.fetch_content_with_retry("https://example.com")
+
+        # Should have retried and succeeded
+        assert html == "<html>test</html>"
+        assert mock_client.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_on_timeout(self, extractor, mock_http):
+        """Test that timeouts trigger retry."""
+        # First call times out, second succeeds
+        mock_client, _ = mock_http(side_effect=[
+            httpx.TimeoutException("timeout"),
+            _response(json_body={"content": "<html>test</html>"}),
+        ])
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
-            mock_settings.return_value.browserless_use_residential_proxy = False
+        html = await extractor.fetch_content_with_retry("https://example.com")
 
-            extractor = UnblockExtractor()
+        assert html == "<html>test</html>"
+        assert mock_client.post.call_count == 2
 
-            # First call fails with 503, second succeeds
-            mock_response_fail = MagicMock()
-            mock_response_fail.status_code = 503
-            mock_response_fail.text = "Service Unavailable"
+    @pytest.mark.asyncio
+    async def test_retries_after_slow_timeout(self, settings, mock_http):
+        """Test that an attempt using its whole timeout still leaves room to retry."""
+        extractor = UnblockExtractor(timeout=0.1)
+        responses = iter([None, _response(json_body={"content": "<html>test</html>"})])
+
+        async def post(*args, timeout, **kwargs):
+            response = next(responses)
+            if response is None:
+                await asyncio.sleep(timeout)
+                raise httpx.TimeoutException("timeout")
+            return response
+
+        mock_client, _ = mock_http(side_effect=post, target=extractor)
+
+        html = await extractor.fetch_content_with_retry(
+            "https://example.com", retry_delay=0
+        )
+
+        assert html == "<html>test</html>"
+        assert mock_client.post.call_count == 2
+        # Each attempt gets a slice of the budget, leaving room for the retry
+        first_timeout = mock_client.post.call_args_list[0].kwargs["timeout"]
+        assert first_timeout == pytest.approx(0.1 / 3, abs=0.01)
 
-            mock_response_success = MagicMock()
-            mock_response_success.status_code = 200
-            mock_response_success.json.return_value = {"content": "<html>test</html>"}
+    @pytest.mark.asyncio
+    async def test_fails_after_max_retries(self, extractor, mock_http):
+        """Test that extraction fails after max retries."""
+        # All calls fail
+        mock_client, _ = mock_http(status=503, text="Service Unavailable")
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(
-                side_effect=[mock_response_fail, mock_response_success]
+        with pytest.raises(ExtractionError):
+            await extractor.fetch_content_with_retry(
+                "https://example.com", max_retries=3
             )
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                html = await extractor.fetch_content_with_retry("https://example.com")
+        # Should have tried max_retries + 1 times (initial + retries)
+        assert mock_client.post.call_count == 4
 
-                # Should have retried and succeeded
-                assert html == "<html>test</html>"
-                assert mock_client.post.call_count == 2
+    @pytest.mark.asyncio
+    async def test_no_retry_on_4xx_error(self, extractor, mock_http):
+        """Test that 4xx errors do not trigger retry."""
+        mock_client, _ = mock_http(status=400, text="Bad Request")
+
+        with pytest.raises(ExtractionError):
+            await extractor.fetch_content_with_retry("https://example.com")
 
+        # Should NOT retry on 4xx errors
+        mock_client.post.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "status,expected_calls",
+        [
+            pytest.param(429, 2, id="rate-limited"),
+            pytest.param(501, 1, id="not-implemented"),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_retries_on_timeout(self):
-        """Test that timeouts trigger retry."""
-        from src.extractors.unblock import UnblockExtractor
-
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
-            mock_settings.return_value.browserless_use_residential_proxy = False
-
-            extractor = UnblockExtractor()
-
-            # First call times out, second succeeds
-            mock_response_success = MagicMock()
-            mock_response_success.status_code = 200
-            mock_response_success.json.return_value = {"content": "<html>test</html>"}
-
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(
-                side_effect=[
-                    httpx.TimeoutException("timeout"),
-                    mock_response_success,
-                ]
+    async def test_retry_depends_on_status(
+        self, extractor, mock_http, status, expected_calls
+    ):
+        """Test that only throttling and transient 5xx statuses are retried."""
+        mock_client, _ = mock_http(status=status, text="Error")
+
+        with pytest.raises(ExtractionError):
+            await extractor.fetch_content_with_retry(
+                "https://example.com", max_retries=1, retry_delay=0
             )
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                html = await extractor.fetch_content_with_retry("https://example.com")
+        assert mock_client.post.call_count == expected_calls
 
-                assert html == "<html>test</html>"
-                assert mock_client.post.call_count == 2
+    @pytest.mark.asyncio
+    async def test_retries_stop_at_total_timeout(self, extractor, mock_http):
+        """Test that hung attempts and backoff together stay within total_timeout."""
+        async def hung_post(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        mock_client, _ = mock_http(side_effect=hung_post)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        with pytest.raises(ExtractionError):
+            await extractor.fetch_content_with_retry(
+                "https://example.com", max_retries=3, retry_delay=0, total_timeout=0.2
+            )
+
+        assert loop.time() - started < 0.3
+        assert mock_client.post.call_count == 4
+        # The budget is split across the attempts instead of each getting it all
+        timeouts = [c.kwargs["timeout"] for c in mock_client.post.call_args_list]
+        assert timeouts[0] == pytest.approx(0.05, abs=0.01)
 
     @pytest.mark.asyncio
-    async def test_fails_after_max_retries(self):
-        """Test that extraction fails after max retries."""
-        from src.extractors.unblock import UnblockExtractor
+    async def test_total_timeout_includes_queueing(self, settings, mock_http):
+        """Test that time waiting for a request slot counts against total_timeout."""
+        settings.browserless_max_concurrency = 1
+        extractor = UnblockExtractor()
+
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.1)
+            return _response()
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
-            mock_settings.return_value.browserless_use_residential_proxy = False
+        mock_http(side_effect=slow_post, target=extractor)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
 
-            extractor = UnblockExtractor()
+        results = await asyncio.gather(
+            *(
+                extractor.fetch_content_with_retry(
+                    f"https://example.com/{i}", max_retries=0, total_timeout=0.2
+                )
+                for i in range(10)
+            ),
+            return_exceptions=True,
+        )
+
+        assert loop.time() - started < 0.4
+        assert any(isinstance(r, ExtractionError) for r in results)
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            pytest.param(None, None, id="missing"),
+            pytest.param("5", 5.0, id="seconds"),
+            pytest.param("-3", 0.0, id="negative-seconds"),
+            pytest.param("Wed, 21 Oct 2015 07:28:00 GMT", 0.0, id="past-http-date"),
+            pytest.param("soon", None, id="malformed"),
+        ],
+    )
+    def test_parse_retry_after(self, header, expected):
+        """Test that Retry-After accepts delay-seconds and HTTP-dates."""
+        assert _parse_retry_after(header) == expected
 
-            # All calls fail
-            mock_response_fail = MagicMock()
-            mock_response_fail.status_code = 503
-            mock_response_fail.text = "Service Unavailable"
+    @pytest.mark.asyncio
+    async def test_retry_waits_for_retry_after(self, extractor, mock_http):
+        """Test that the retry delay is at least the server's Retry-After."""
+        mock_http(side_effect=[
+            _response(429, text="Too Many Requests", headers={"Retry-After": "2"}),
+            _response(),
+        ])
+
+        with patch("src.extractors.unblock.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            html = await extractor.fetch_content_with_retry(
+                "https://example.com", retry_delay=0
+            )
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response_fail)
+        assert html == "<html>test</html>"
+        mock_sleep.assert_awaited_once_with(2.0)
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                with pytest.raises(ExtractionError):
-                    await extractor.fetch_content_with_retry(
-                        "https://example.com", max_retries=3
-                    )
+    @pytest.mark.asyncio
+    async def test_retry_after_beyond_backoff_cap_is_waited(self, extractor, mock_http):
+        """Test that a Retry-After longer than BACKOFF_MAX_DELAY is honored within budget."""
+        retry_after = extractor.BACKOFF_MAX_DELAY + 10
+        mock_http(side_effect=[
+            _response(
+                503, text="Service Unavailable", headers={"Retry-After": str(retry_after)}
+            ),
+            _response(),
+        ])
+
+        with patch("src.extractors.unblock.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            html = await extractor.fetch_content_with_retry(
+                "https://example.com", retry_delay=0, total_timeout=retry_after * 2
+            )
 
-                # Should have tried max_retries + 1 times (initial + retries)
-                assert mock_client.post.call_count == 4
+        assert html == "<html>test</html>"
+        mock_sleep.assert_awaited_once_with(retry_after)
 
     @pytest.mark.asyncio
-    async def test_no_retry_on_4xx_error(self):
-        """Test that 4xx errors do not trigger retry."""
-        from src.extractors.unblock import UnblockExtractor
+    async def test_no_retry_when_retry_after_exceeds_deadline(
+        self, extractor, mock_http
+    ):
+        """Test that a Retry-After past the deadline gives up and counts as a failure."""
+        mock_client, _ = mock_http(
+            status=503,
+            text="Service Unavailable",
+            headers={"Retry-After": str(extractor.timeout + 1)},
+        )
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
-            mock_settings.return_value.browserless_use_residential_proxy = False
+        with pytest.raises(ExtractionError):
+            await extractor.fetch_content_with_retry("https://example.com")
 
-            extractor = UnblockExtractor()
+        mock_client.post.assert_called_once()
+        metrics = get_fallback_circuit_breaker().get_metrics()
+        assert metrics["browserless_unblock"]["failures"] == 1
 
-            mock_response = MagicMock()
-            mock_response.status_code = 400
-            mock_response.text = "Bad Request"
+    @pytest.mark.parametrize("attempt", [0, 1, 2, 10])
+    def test_backoff_delay_uses_full_jitter(self, extractor, attempt):
+        """Test that backoff delays fall between zero and the capped ceiling."""
+        ceiling = min(extractor.BACKOFF_MAX_DELAY, 1.0 * 2 ** attempt)
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+        with patch("src.extractors.unblock.random.uniform") as mock_uniform:
+            extractor._calculate_backoff_delay(attempt, 1.0)
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                with pytest.raises(ExtractionError):
-                    await extractor.fetch_content_with_retry("https://example.com")
+        mock_uniform.assert_called_once_with(0, ceiling)
 
-                # Should NOT retry on 4xx errors
-                assert mock_client.post.call_count == 1
 
+class TestUnblockExtractorCircuitBreaker:
+    """Tests for failing fast while Browserless is down."""
 
-class TestUnblockExtractorWaitForOptions:
-    """Tests for waitFor configuration options."""
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_request(self, extractor, mock_http):
+        """Test that fetches stop reaching Browserless once the circuit opens."""
+        threshold = get_fallback_circuit_breaker().failure_threshold
+        mock_client, _ = mock_http(status=503, text="Service Unavailable")
+
+        for _ in range(threshold):
+            with pytest.raises(ExtractionError):
+                await extractor.fetch_content_with_retry(
+                    "https://example.com", max_retries=0
+                )
+
+        with pytest.raises(ExtractionError) as exc_info:
+            await extractor.fetch_content_with_retry(
+                "https://example.com", max_retries=0
+            )
+
+        assert "circuit open" in str(exc_info.value)
+        assert mock_client.post.call_count == threshold
 
     @pytest.mark.asyncio
-    async def test_wait_for_timeout_in_payload(self):
-        """Test that waitForTimeout is included in API payload."""
-        from src.extractors.unblock import UnblockExtractor
+    async def test_deadline_give_up_counts_as_failure(self, settings, mock_http):
+        """Test that timeouts cut short by the deadline still count toward opening."""
+        extractor = UnblockExtractor(timeout=0.1)
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
-            mock_settings.return_value.browserless_use_residential_proxy = False
+        async def post(*args, timeout, **kwargs):
+            await asyncio.sleep(timeout)
+            raise httpx.TimeoutException("timeout")
 
-            extractor = UnblockExtractor()
+        mock_http(side_effect=post, target=extractor)
 
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"content": "<html>test</html>"}
+        with pytest.raises(ExtractionError):
+            await extractor.fetch_content_with_retry(
+                "https://example.com", max_retries=5, retry_delay=0, total_timeout=0.15
+            )
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+        metrics = get_fallback_circuit_breaker().get_metrics()
+        assert metrics["browserless_unblock"]["failures"] == 1
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                await extractor.fetch_content(
-                    "https://example.com", wait_for_timeout=2000
-                )
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_circuit(self, extractor, mock_http):
+        """Test that 4xx responses are not counted as Browserless failures."""
+        threshold = get_fallback_circuit_breaker().failure_threshold
+        mock_client, _ = mock_http(status=400, text="Bad Request")
 
-                call_args = mock_client.post.call_args
-                payload = call_args[1]["json"]
-                assert payload.get("waitForTimeout") == 2000
+        for _ in range(threshold + 1):
+            with pytest.raises(ExtractionError):
+                await extractor.fetch_content_with_retry("https://example.com")
+
+        assert mock_client.post.call_count == threshold + 1
+
+
+class TestUnblockExtractorWaitForOptions:
+    """Tests for waitFor configuration options."""
 
     @pytest.mark.asyncio
-    async def test_wait_for_selector_in_payload(self):
-        """Test that waitForSelector is included in API payload."""
-        from src.extractors.unblock import UnblockExtractor
+    async def test_wait_for_timeout_in_payload(self, extractor, mock_http):
+        """Test that waitForTimeout is included in API payload."""
+        mock_client, _ = mock_http()
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
-            mock_settings.return_value.browserless_use_residential_proxy = False
+        await extractor.fetch_content(
+            "https://example.com", wait_for_timeout=2000
+        )
 
-            extractor = UnblockExtractor()
+        mock_client.post.assert_called_once()
+        payload = mock_client.post.call_args.kwargs["json"]
+        assert payload.get("waitForTimeout") == 2000
 
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"content": "<html>test</html>"}
+    @pytest.mark.asyncio
+    async def test_wait_for_selector_in_payload(self, extractor, mock_http):
+        """Test that waitForSelector is included in API payload."""
+        mock_client, _ = mock_http()
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+        await extractor.fetch_content(
+            "https://example.com", wait_for_selector="article"
+        )
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                await extractor.fetch_content(
-                    "https://example.com", wait_for_selector="article"
-                )
+        mock_client.post.assert_called_once()
+        payload = mock_client.post.call_args.kwargs["json"]
+        assert payload.get("waitForSelector") == {"selector": "article"}
 
-                call_args = mock_client.post.call_args
-                payload = call_args[1]["json"]
-                assert payload.get("waitForSelector") == {"selector": "article"}
+    @pytest.mark.asyncio
+    async def test_wait_options_do_not_leak_between_requests(
+        self, extractor, mock_http
+    ):
+        """Test that waitFor options set for one request are not reused."""
+        mock_client, _ = mock_http()
+
+        await extractor.fetch_content("https://example.com/a", wait_for_timeout=2000)
+        await extractor.fetch_content("https://example.com/b")
+
+        payload = mock_client.post.call_args.kwargs["json"]
+        assert payload == {"url": "https://example.com/b", "content": True}
 
 
 class TestUnblockExtractorGracefulDegradation:
     """Tests for graceful degradation when API is unavailable."""
 
     @pytest.mark.asyncio
-    async def test_returns_none_when_disabled(self):
+    async def test_returns_none_when_disabled(self, settings):
         """Test that extractor returns gracefully when disabled."""
-        from src.extractors.unblock import UnblockExtractor
+        settings.browserless_api_key = None
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = None
-            mock_settings.return_value.extraction_timeout = 30
-
-            extractor = UnblockExtractor()
+        extractor = UnblockExtractor()
 
-            # Should raise ExtractionError, not crash
-            with pytest.raises(ExtractionError) as exc_info:
-                await extractor.fetch_content("https://example.com")
+        # Should raise ExtractionError, not crash
+        with pytest.raises(ExtractionError) as exc_info:
+            await extractor.fetch_content("https://example.com")
 
-            assert "api key" in str(exc_info.value).lower()
+        assert "api key" in str(exc_info.value).lower()
 
     @pytest.mark.asyncio
-    async def test_handles_connection_refused(self):
+    async def test_handles_connection_refused(self, extractor, mock_http):
         """Test graceful handling of connection refused errors."""
-        from src.extractors.unblock import UnblockExtractor
+        mock_http(side_effect=httpx.ConnectError("Connection refused"))
 
-        with patch("src.extractors.unblock.get_settings") as mock_settings:
-            mock_settings.return_value.browserless_api_key = "test_key"
-            mock_settings.return_value.extraction_timeout = 30
+        with pytest.raises(ExtractionError) as exc_info:
+            await extractor.fetch_content("https://example.com")
 
-            extractor = UnblockExtractor()
+        # Error should be wrapped in ExtractionError
+        assert "Connection refused" in str(exc_info.value) or "request failed" in str(exc_info.value).lower()
 
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(
-                side_effect=httpx.ConnectError("Connection refused")
-            )
+    @pytest.mark.asyncio
+    async def test_connection_refused_limits_retries(self, extractor, mock_http):
+        """Test that refused connections don't use the full retry budget."""
+        mock_client, _ = mock_http(side_effect=httpx.ConnectError("Connection refused"))
 
-            with patch.object(extractor, "get_client", return_value=mock_client):
-                with pytest.raises(ExtractionError) as exc_info:
-                    await extractor.fetch_content("https://example.com")
+        with pytest.raises(ExtractionError):
+            await extractor.fetch_content_with_retry(
+                "https://example.com", max_retries=5, retry_delay=0
+            )
 
-                # Error should be wrapped in ExtractionError
-                assert "Connection refused" in str(exc_info.value) or "request failed" in str(exc_info.value).lower()
+        assert mock_client.post.call_count == extractor.CONNECT_ERROR_MAX_RETRIES + 1
 
 
 class TestUnblockExtractorIntegration:
@@ -838,8 +955,6 @@ class TestUnblockExtractorIntegration:
     async def test_real_api_call(self):
         """Test against real Browserless API."""
         import os
-        from src.extractors.unblock import UnblockExtractor
-
         # Only run if API key is set
         api_key = os.environ.get("BROWSERLESS_API_KEY")
         if not api_key:
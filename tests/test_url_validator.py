@@ -183,6 +183,43 @@ class TestValidateUrl:
         
         assert result.is_valid is True
     
+    def test_validation_result_is_immutable(self):
+        """Should return a frozen, slotted result."""
+        from dataclasses import FrozenInstanceError
+        from src.utils.url_validator import validate_url
+        
+        result = validate_url("https://example.com")
+        
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            result.is_valid = False
+    
+    def test_accept_ipv6_host(self):
+        """Should accept bracketed IPv6 hosts that skip the fast path."""
+        from src.utils.url_validator import validate_url
+        
+        result = validate_url("http://[::1]:8080/path")
+        
+        assert result.is_valid is True
+    
+    def test_reject_unbalanced_bracket_in_host(self):
+        """Should reject hosts the fast path leaves to urlsplit."""
+        from src.utils.url_validator import validate_url
+        
+        result = validate_url("https://example.com]/path")
+    
+        assert result.is_valid is False
+        assert result.error is not None
+    
+    def test_reject_host_invalid_under_nfkc(self):
+        """Should reject non-ASCII hosts that normalize into a different netloc."""
+        from src.utils.url_validator import validate_url
+    
+        result = validate_url("https://exa／mple.com@evil.com/x")
+    
+        assert result.is_valid is False
+        assert "NFKC" in result.error
+    
     def test_handle_unicode_in_path(self):
         """Should handle URLs with unicode characters in path."""
         from src.utils.url_validator import validate_url
@@ -314,6 +351,15 @@ another-invalid"""
         assert 2 in invalid_line_numbers
         assert 4 in invalid_line_numbers
     
+    def test_parse_reject_host_invalid_under_nfkc(self):
+        """Should validate plain URL lines whose host is not plain ASCII."""
+        from src.utils.url_validator import parse_url_input
+        
+        result = parse_url_input("https://exa／mple.com@evil.com/x\nhttps://example.com/ok")
+        
+        assert result.valid_urls == ["https://example.com/ok"]
+        assert [line[0] for line in result.invalid_lines] == [1]
+    
     def test_parse_extract_from_markdown_wrapped_urls(self):
         """Should extract URLs from markdown link syntax."""
         from src.utils.url_validator import parse_url_input
@@ -340,6 +386,21 @@ another-invalid"""
         assert len(result.valid_urls) == 150
         assert any("large" in w.lower() or "many" in w.lower() for w in result.warnings)
     
+    def test_parse_crlf_and_indented_lines(self):
+        """Should treat CRLF endings and indentation like plain URL lines."""
+        from src.utils.url_validator import parse_url_input
+        
+        text = "https://example.com/a\r\n\thttps://example.com/b  \r\nnot a url\r\n"
+        
+        result = parse_url_input(text)
+        
+        assert result.valid_urls == [
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+        assert result.invalid_lines[0][0] == 3
+        assert result.skipped_lines == 1
+    
     def test_parse_real_batch_urls_file(self):
         """Should correctly parse content like batch_urls.txt."""
         from src.utils.url_validator import parse_url_input
@@ -419,6 +480,21 @@ class TestSanitizeUrlList:
         
         # Should dedupe these as same URL
         assert len(result.urls) == 1
+    
+    def test_sanitize_normalize_trailing_slash_on_bare_host(self):
+        """Should treat a bare host with/without trailing slash as same."""
+        from src.utils.url_validator import sanitize_url_list
+        
+        urls = [
+            "https://example.com/",
+            "https://example.com",
+        ]
+        
+        result = sanitize_url_list(urls)
+        
+        # First spelling wins
+        assert result.urls == ["https://example.com/"]
+        assert result.duplicates_removed == 1
 
 
 # =============================================================================